@@ -7,11 +7,18 @@ This script removes personal transaction data while maintaining file structure.
 """
 
 import json
+import os
+import shutil
 import sys
 import argparse
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
 # Color codes for terminal output
 class Colors:
     RED = '\033[0;31m'
@@ -20,6 +27,59 @@ class Colors:
     BLUE = '\033[0;34m'
     NC = '\033[0m'  # No Color
 
+# No escape codes when output is piped or redirected
+if not sys.stdout.isatty():
+    Colors.RED = Colors.GREEN = Colors.YELLOW = Colors.BLUE = Colors.NC = ''
+
+# Static banner blocks, formatted once at import
+_WARNING_HEADER = '\n'.join([
+    f"{Colors.RED}{'='*60}{Colors.NC}",
+    f"{Colors.RED}🚨 CRITICAL WARNING - PII DATA DELETION 🚨{Colors.NC}",
+    f"{Colors.RED}{'='*60}{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}⚠️  This script will PERMANENTLY DELETE your personal transaction data:{Colors.NC}",
+])
+
+_WARNING_FOOTER = '\n'.join([
+    "",
+    f"{Colors.RED}🔥 NO BACKUPS WILL BE CREATED{Colors.NC}",
+    f"{Colors.RED}🔥 THIS ACTION CANNOT BE UNDONE{Colors.NC}",
+    f"{Colors.RED}🔥 ALL YOUR TRANSACTION DATA WILL BE LOST{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}📋 What will remain:{Colors.NC}",
+    "   • Template structure for JSON files",
+    "   • CSV header for FA calculations",
+    "   • public_data.json (market data cache)",
+    "",
+    f"{Colors.RED}{'='*60}{Colors.NC}",
+    "",
+])
+
+_COMPLETION_HEADER = '\n'.join([
+    "",
+    f"{Colors.GREEN}{'='*50}{Colors.NC}",
+    f"{Colors.GREEN}✅ PII CLEANUP COMPLETED{Colors.NC}",
+    f"{Colors.GREEN}{'='*50}{Colors.NC}",
+    "",
+    f"{Colors.GREEN}📋 Files processed:{Colors.NC}",
+])
+
+_COMPLETION_FOOTER = '\n'.join([
+    "",
+    f"{Colors.YELLOW}📝 What happened:{Colors.NC}",
+    "   • All personal transaction data has been removed",
+    "   • Template structures have been created",
+    "   • You can now safely share these files",
+    "",
+    f"{Colors.BLUE}💡 Next steps:{Colors.NC}",
+    "   1. Add your actual transaction data to the template files",
+    "   2. Run fa_calculator.py to generate FA schedule",
+    "   3. The public_data.json cache remains intact for faster processing",
+    "",
+    f"{Colors.YELLOW}⚠️  Remember: This cleanup removed your actual data!{Colors.NC}",
+    f"{Colors.YELLOW}   Make sure you have your transaction records elsewhere.{Colors.NC}",
+])
+
 class PIICleanup:
     def __init__(self, data_dir: str = None):
         # Set data directory - default to script directory
@@ -34,28 +94,59 @@ class PIICleanup:
         self.sell_file = self.data_dir / "sell.json"
         self.fa_csv = self.data_dir / "FA.csv"
         
+        # Cached stat() results, see _exists()
+        self._exists_cache = {}
+        
+    def _exists(self, path: Path) -> bool:
+        """Check whether a file exists, reusing the result of earlier checks"""
+        if path not in self._exists_cache:
+            self._exists_cache[path] = path.exists()
+        return self._exists_cache[path]
+    
+    def _decode_json(self, raw: bytes) -> Dict[str, Any]:
+        """Decode JSON bytes (orjson's JSONDecodeError subclasses json.JSONDecodeError)"""
+        if orjson:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    
+    def _encode_json(self, data: Dict[str, Any]) -> bytes:
+        """Encode data as indented JSON bytes"""
+        if orjson:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2).encode()
+    
+    def _write_atomic(self, path: Path, payload: bytes):
+        """Write payload with a single write and atomically replace the target file
+        
+        The replacement keeps the original file's permissions, and a failed write
+        removes the temp file.
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                shutil.copymode(path, tmp_path)
+            except FileNotFoundError:
+                pass  # New file, keep the default permissions
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+        self._exists_cache[path] = True
+    
     def show_warning(self):
         """Display critical warning messages"""
-        print(f"{Colors.RED}{'='*60}{Colors.NC}")
-        print(f"{Colors.RED}🚨 CRITICAL WARNING - PII DATA DELETION 🚨{Colors.NC}")
-        print(f"{Colors.RED}{'='*60}{Colors.NC}")
-        print()
-        print(f"{Colors.YELLOW}⚠️  This script will PERMANENTLY DELETE your personal transaction data:{Colors.NC}")
+        print(_WARNING_HEADER)
         print(f"   • {self.vest_file} - Your stock vest records")
         print(f"   • {self.sell_file} - Your stock sale records") 
         print(f"   • {self.fa_csv} - Your calculated FA schedule")
-        print()
-        print(f"{Colors.RED}🔥 NO BACKUPS WILL BE CREATED{Colors.NC}")
-        print(f"{Colors.RED}🔥 THIS ACTION CANNOT BE UNDONE{Colors.NC}")
-        print(f"{Colors.RED}🔥 ALL YOUR TRANSACTION DATA WILL BE LOST{Colors.NC}")
-        print()
-        print(f"{Colors.YELLOW}📋 What will remain:{Colors.NC}")
-        print("   • Template structure for JSON files")
-        print("   • CSV header for FA calculations")
-        print("   • public_data.json (market data cache)")
-        print()
-        print(f"{Colors.RED}{'='*60}{Colors.NC}")
-        print()
+        print(_WARNING_FOOTER)
     
     def get_confirmation(self) -> bool:
         """Get double confirmation from user"""
@@ -85,8 +176,8 @@ class PIICleanup:
         """Create template structure based on current vest.json"""
         try:
             # Load current vest.json
-            with open(self.vest_file, 'r') as f:
-                current_data = json.load(f)
+            with open(self.vest_file, 'rb') as f:
+                current_data = self._decode_json(f.read())
             
             # Keep only UBER data, set all share counts to 0
             if "UBER" in current_data:
@@ -118,9 +209,9 @@ class PIICleanup:
         """Create template structure for sell.json based on current data"""
         try:
             # Load current sell.json if it exists
-            if self.sell_file.exists():
-                with open(self.sell_file, 'r') as f:
-                    current_data = json.load(f)
+            if self._exists(self.sell_file):
+                with open(self.sell_file, 'rb') as f:
+                    current_data = self._decode_json(f.read())
                 
                 # Keep only UBER data, set all share counts to 1 for template
                 if "UBER" in current_data:
@@ -175,70 +266,47 @@ class PIICleanup:
         files_processed = []
         
         # Clean up vest.json
-        if self.vest_file.exists():
+        if self._exists(self.vest_file):
             print(f"{Colors.YELLOW}🗑️  Cleaning {self.vest_file}...{Colors.NC}")
             template = self.create_vest_template()
-            with open(self.vest_file, 'w') as f:
-                json.dump(template, f, indent=2)
+            self._write_atomic(self.vest_file, self._encode_json(template))
             files_processed.append(str(self.vest_file))
         else:
             print(f"{Colors.BLUE}ℹ️  {self.vest_file} not found, creating template...{Colors.NC}")
             template = self.create_vest_template()
-            with open(self.vest_file, 'w') as f:
-                json.dump(template, f, indent=2)
+            self._write_atomic(self.vest_file, self._encode_json(template))
             files_processed.append(f"{self.vest_file} (created)")
         
         # Clean up sell.json
-        if self.sell_file.exists():
+        if self._exists(self.sell_file):
             print(f"{Colors.YELLOW}🗑️  Cleaning {self.sell_file}...{Colors.NC}")
             template = self.create_sell_template()
-            with open(self.sell_file, 'w') as f:
-                json.dump(template, f, indent=2)
+            self._write_atomic(self.sell_file, self._encode_json(template))
             files_processed.append(str(self.sell_file))
         else:
             print(f"{Colors.BLUE}ℹ️  {self.sell_file} not found, creating template...{Colors.NC}")
             template = self.create_sell_template()
-            with open(self.sell_file, 'w') as f:
-                json.dump(template, f, indent=2)
+            self._write_atomic(self.sell_file, self._encode_json(template))
             files_processed.append(f"{self.sell_file} (created)")
         
         # Clean up FA.csv
-        if self.fa_csv.exists():
+        if self._exists(self.fa_csv):
             print(f"{Colors.YELLOW}🗑️  Cleaning {self.fa_csv}...{Colors.NC}")
-            with open(self.fa_csv, 'w') as f:
-                f.write(self.create_fa_csv_template())
+            self._write_atomic(self.fa_csv, self.create_fa_csv_template().encode())
             files_processed.append(str(self.fa_csv))
         else:
             print(f"{Colors.BLUE}ℹ️  {self.fa_csv} not found, creating template...{Colors.NC}")
-            with open(self.fa_csv, 'w') as f:
-                f.write(self.create_fa_csv_template())
+            self._write_atomic(self.fa_csv, self.create_fa_csv_template().encode())
             files_processed.append(f"{self.fa_csv} (created)")
         
         return files_processed
     
     def show_completion_message(self, files_processed: list):
         """Show completion message with summary"""
-        print()
-        print(f"{Colors.GREEN}{'='*50}{Colors.NC}")
-        print(f"{Colors.GREEN}✅ PII CLEANUP COMPLETED{Colors.NC}")
-        print(f"{Colors.GREEN}{'='*50}{Colors.NC}")
-        print()
-        print(f"{Colors.GREEN}📋 Files processed:{Colors.NC}")
+        print(_COMPLETION_HEADER)
         for file_info in files_processed:
             print(f"   ✓ {file_info}")
-        print()
-        print(f"{Colors.YELLOW}📝 What happened:{Colors.NC}")
-        print("   • All personal transaction data has been removed")
-        print("   • Template structures have been created")
-        print("   • You can now safely share these files")
-        print()
-        print(f"{Colors.BLUE}💡 Next steps:{Colors.NC}")
-        print("   1. Add your actual transaction data to the template files")
-        print("   2. Run fa_calculator.py to generate FA schedule")
-        print("   3. The public_data.json cache remains intact for faster processing")
-        print()
-        print(f"{Colors.YELLOW}⚠️  Remember: This cleanup removed your actual data!{Colors.NC}")
-        print(f"{Colors.YELLOW}   Make sure you have your transaction records elsewhere.{Colors.NC}")
+        print(_COMPLETION_FOOTER)
     
     def run(self):
         """Main execution function"""
@@ -270,8 +338,8 @@ class PIICleanup:
             sys.exit(1)
 
 
-def main():
-    """Main entry point"""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
     parser = argparse.ArgumentParser(
         description="Remove personal transaction data while maintaining file structure",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -285,7 +353,12 @@ Examples:
     parser.add_argument('--data', default=None,
                        help='Data directory containing vest.json, sell.json, FA.csv (default: script directory)')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point"""
+    args = build_parser().parse_args()
     
     cleanup = PIICleanup(data_dir=args.data)
     cleanup.run()
@@ -8,11 +8,23 @@ Granular control over cached public data cleanup.
 
 import json
 import argparse
+import os
 import sys
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, fall back to loading the whole file
+    ijson = None
 
 # Color codes for terminal output
 class Colors:
@@ -22,7 +34,42 @@ class Colors:
     BLUE = '\033[0;34m'
     NC = '\033[0m'  # No Color
 
+# No escape codes when output is piped or redirected
+if not sys.stdout.isatty():
+    Colors.RED = Colors.GREEN = Colors.YELLOW = Colors.BLUE = Colors.NC = ''
+
+# Static message blocks, formatted once at import
+_NEXT_STEPS = '\n'.join([
+    "",
+    f"{Colors.YELLOW}💡 Next steps:{Colors.NC}",
+    "  1. Run fa_calculator.py to fetch new data",
+    "  2. Data fetched from internet will be shown in RED",
+    "  3. Future runs will use cached data (shown in GREEN)",
+])
+
+_DATA_STRUCTURE_HELP = '\n'.join([
+    "",
+    f"{Colors.BLUE}📖 Data structure:{Colors.NC}",
+    "  - stocks.<SYMBOL>.company_info: Company details",
+    "  - stocks.<SYMBOL>.prices: Historical stock prices",
+    "  - exchange_rates: USD to INR rates by date",
+])
+
 class PublicDataCleanup:
+    # Read-only default; copy with dict() before storing it in public data
+    DEFAULT_COUNTRY_MAPPING = MappingProxyType({
+        "United States": 2,
+        "United Kingdom": 3,
+        "Canada": 4,
+        "Germany": 5,
+        "France": 6,
+        "Japan": 7,
+        "Australia": 8,
+        "Netherlands": 9,
+        "Switzerland": 10,
+        "Singapore": 11
+    })
+    
     def __init__(self):
         self.public_data_file = Path("public_data.json")
         
@@ -39,61 +86,93 @@ class PublicDataCleanup:
             return self.create_empty_structure()
         
         try:
-            with open(self.public_data_file, 'r') as f:
-                return json.load(f)
+            with open(self.public_data_file, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson else json.loads(raw)
         except (json.JSONDecodeError, IOError) as e:
             print(f"{Colors.RED}❌ Error reading {self.public_data_file}: {e}{Colors.NC}")
             return self.create_empty_structure()
     
     def save_public_data(self, data: Dict[str, Any]):
         """Save public data with sorting"""
-        # Sort stocks alphabetically and dates chronologically
-        sorted_data = {
-            "stocks": {},
-            "exchange_rates": dict(sorted(data.get("exchange_rates", {}).items())),
-            "country_mapping": data.get("country_mapping", {
-                "United States": 2,
-                "United Kingdom": 3,
-                "Canada": 4,
-                "Germany": 5,
-                "France": 6,
-                "Japan": 7,
-                "Australia": 8,
-                "Netherlands": 9,
-                "Switzerland": 10,
-                "Singapore": 11
-            })
+        # Sorting is left to the encoder: stocks alphabetically, dates chronologically
+        output = {
+            "stocks": data.get("stocks", {}),
+            "exchange_rates": data.get("exchange_rates", {}),
+            "country_mapping": data.get("country_mapping", dict(self.DEFAULT_COUNTRY_MAPPING))
         }
         
-        # Sort stock data
-        for symbol in sorted(data.get("stocks", {}).keys()):
-            stock_data = data["stocks"][symbol]
-            sorted_data["stocks"][symbol] = {
-                "prices": dict(sorted(stock_data.get("prices", {}).items())),
-                "company_info": stock_data.get("company_info", {}),
-                "high_low": dict(sorted(stock_data.get("high_low", {}).items()))
-            }
-        
-        with open(self.public_data_file, 'w') as f:
-            json.dump(sorted_data, f, indent=2)
+        with open(self.public_data_file, 'wb') as f:
+            f.write(self.encode_json(output))
+    
+    def encode_json(self, obj: Any, level: int = 0) -> bytes:
+        """Encode JSON with sorted keys, indented to sit at the given nesting level"""
+        if orjson:
+            payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(obj, indent=2, sort_keys=True).encode()
+        
+        if level:
+            # Encoded JSON never contains raw newlines inside strings
+            payload = payload.replace(b'\n', b'\n' + b'  ' * level)
+        return payload
+    
+    def get_stock_symbols(self) -> List[str]:
+        """List cached stock symbols in file order"""
+        if ijson and self.public_data_file.exists():
+            try:
+                with open(self.public_data_file, 'rb') as f:
+                    return [symbol for symbol, _ in ijson.kvitems(f, 'stocks', use_float=True)]
+            except (ijson.JSONError, IOError):
+                pass  # Let the full loader report the problem
+        
+        return list(self.load_public_data().get("stocks", {}).keys())
+    
+    def stream_delete_stock(self, stock_symbol: str):
+        """Rewrite public data without one stock, holding a single stock in memory at a time"""
+        tmp_file = self.public_data_file.with_name(self.public_data_file.name + ".tmp")
+        
+        try:
+            with open(self.public_data_file, 'rb') as src, open(tmp_file, 'wb') as dst:
+                country_mapping = next(ijson.items(src, 'country_mapping', use_float=True), None)
+                src.seek(0)
+                exchange_rates = next(ijson.items(src, 'exchange_rates', use_float=True), None)
+                src.seek(0)
+                
+                # Same layout as save_public_data: top-level keys in sorted order
+                dst.write(b'{\n  "country_mapping": ')
+                dst.write(self.encode_json(country_mapping or dict(self.DEFAULT_COUNTRY_MAPPING), 1))
+                dst.write(b',\n  "exchange_rates": ')
+                dst.write(self.encode_json(exchange_rates or {}, 1))
+                dst.write(b',\n  "stocks": {')
+                
+                written = 0
+                for symbol, stock_data in ijson.kvitems(src, 'stocks', use_float=True):
+                    if symbol == stock_symbol:
+                        continue
+                    dst.write(b',\n    ' if written else b'\n    ')
+                    dst.write(self.encode_json(symbol) + b': ' + self.encode_json(stock_data, 2))
+                    written += 1
+                
+                dst.write(b'\n  }\n}' if written else b'}\n}')
+            
+            # Keep the original file's permissions on the replacement
+            shutil.copymode(self.public_data_file, tmp_file)
+            os.replace(tmp_file, self.public_data_file)
+        except BaseException:
+            # Don't leave a partial temp file behind
+            try:
+                tmp_file.unlink()
+            except FileNotFoundError:
+                pass
+            raise
     
     def create_empty_structure(self) -> Dict[str, Any]:
         """Create empty public data structure"""
         return {
             "stocks": {},
             "exchange_rates": {},
-            "country_mapping": {
-                "United States": 2,
-                "United Kingdom": 3,
-                "Canada": 4,
-                "Germany": 5,
-                "France": 6,
-                "Japan": 7,
-                "Australia": 8,
-                "Netherlands": 9,
-                "Switzerland": 10,
-                "Singapore": 11
-            }
+            "country_mapping": dict(self.DEFAULT_COUNTRY_MAPPING)
         }
     
     def create_sample_structure(self) -> Dict[str, Any]:
@@ -124,18 +203,7 @@ class PublicDataCleanup:
                 "2024-01-02": 83.25,
                 "2024-01-03": 83.18
             },
-            "country_mapping": {
-                "United States": 2,
-                "United Kingdom": 3,
-                "Canada": 4,
-                "Germany": 5,
-                "France": 6,
-                "Japan": 7,
-                "Australia": 8,
-                "Netherlands": 9,
-                "Switzerland": 10,
-                "Singapore": 11
-            }
+            "country_mapping": dict(self.DEFAULT_COUNTRY_MAPPING)
         }
     
     def create_backup(self) -> Optional[Path]:
@@ -147,7 +215,8 @@ class PublicDataCleanup:
         backup_file = Path(f"public_data.json.backup_{timestamp}")
         
         try:
-            shutil.copy2(self.public_data_file, backup_file)
+            # Timestamp is in the backup name, so file metadata need not be copied
+            shutil.copyfile(self.public_data_file, backup_file)
             print(f"{Colors.GREEN}💾 Backup created: {backup_file}{Colors.NC}")
             return backup_file
         except IOError as e:
@@ -194,18 +263,7 @@ class PublicDataCleanup:
         cleaned_data = {
             "stocks": {"UBER": uber_data} if uber_data else {},
             "exchange_rates": data.get("exchange_rates", {}),
-            "country_mapping": data.get("country_mapping", {
-                "United States": 2,
-                "United Kingdom": 3,
-                "Canada": 4,
-                "Germany": 5,
-                "France": 6,
-                "Japan": 7,
-                "Australia": 8,
-                "Netherlands": 9,
-                "Switzerland": 10,
-                "Singapore": 11
-            })
+            "country_mapping": data.get("country_mapping", dict(self.DEFAULT_COUNTRY_MAPPING))
         }
         
         self.save_public_data(cleaned_data)
@@ -227,18 +285,7 @@ class PublicDataCleanup:
         cleaned_data = {
             "stocks": data.get("stocks", {}),
             "exchange_rates": {},
-            "country_mapping": data.get("country_mapping", {
-                "United States": 2,
-                "United Kingdom": 3,
-                "Canada": 4,
-                "Germany": 5,
-                "France": 6,
-                "Japan": 7,
-                "Australia": 8,
-                "Netherlands": 9,
-                "Switzerland": 10,
-                "Singapore": 11
-            })
+            "country_mapping": data.get("country_mapping", dict(self.DEFAULT_COUNTRY_MAPPING))
         }
         
         self.save_public_data(cleaned_data)
@@ -248,12 +295,11 @@ class PublicDataCleanup:
     
     def delete_stock_data(self, stock_symbol: str):
         """Delete data for a specific stock symbol"""
-        data = self.load_public_data()
-        stocks = data.get("stocks", {})
+        symbols = self.get_stock_symbols()
         
-        if stock_symbol not in stocks:
+        if stock_symbol not in symbols:
             print(f"{Colors.RED}❌ Stock symbol '{stock_symbol}' not found in cache{Colors.NC}")
-            print(f"{Colors.BLUE}💡 Available symbols: {', '.join(sorted(stocks.keys())) if stocks else 'None'}{Colors.NC}")
+            print(f"{Colors.BLUE}💡 Available symbols: {', '.join(sorted(symbols)) if symbols else 'None'}{Colors.NC}")
             return
         
         if not self.get_confirmation(f"cached data for {stock_symbol}"):
@@ -262,21 +308,21 @@ class PublicDataCleanup:
         
         backup_file = self.create_backup()
         
-        # Remove the specific stock
-        del data["stocks"][stock_symbol]
-        
-        self.save_public_data(data)
+        # Streaming keeps file order, so only use it when stocks are already sorted
+        if ijson and symbols == sorted(symbols):
+            self.stream_delete_stock(stock_symbol)
+        else:
+            # Remove the specific stock
+            data = self.load_public_data()
+            del data["stocks"][stock_symbol]
+            self.save_public_data(data)
         
         print(f"{Colors.GREEN}✅ Data for {stock_symbol} deleted{Colors.NC}")
         self.show_completion_message(backup_file)
     
     def show_completion_message(self, backup_file: Optional[Path]):
         """Show completion message with next steps"""
-        print()
-        print(f"{Colors.YELLOW}💡 Next steps:{Colors.NC}")
-        print("  1. Run fa_calculator.py to fetch new data")
-        print("  2. Data fetched from internet will be shown in RED")
-        print("  3. Future runs will use cached data (shown in GREEN)")
+        print(_NEXT_STEPS)
         
         if backup_file:
             print()
@@ -284,11 +330,7 @@ class PublicDataCleanup:
             print(f"  • Backup saved as: {backup_file}")
             print(f"  • Restore with: mv {backup_file} {self.public_data_file}")
         
-        print()
-        print(f"{Colors.BLUE}📖 Data structure:{Colors.NC}")
-        print("  - stocks.<SYMBOL>.company_info: Company details")
-        print("  - stocks.<SYMBOL>.prices: Historical stock prices")
-        print("  - exchange_rates: USD to INR rates by date")
+        print(_DATA_STRUCTURE_HELP)
     
     def show_help(self):
         """Show help message"""
@@ -15,17 +15,130 @@ import requests
 import argparse
 import sys
 import os
+import re
+import shutil
+import threading
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 import csv
-from io import StringIO
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import TextIOWrapper
+from itertools import accumulate
+from operator import itemgetter
 import urllib3
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
 # Disable urllib3 warnings
 urllib3.disable_warnings()
 
+@lru_cache(maxsize=4096)
+def _day_bounds(day: str) -> Tuple[int, int]:
+    """Epoch seconds of the local midnights starting and ending a YYYY-MM-DD day"""
+    start = datetime.fromisoformat(day)
+    # The next midnight is not always 24 hours away across DST changes
+    return int(start.timestamp()), int((start + timedelta(days=1)).timestamp())
+
+# Request headers for the Yahoo chart API, shared by every request
+_CHART_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0'
+})
+
+_RANGE_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://finance.yahoo.com/',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache'
+})
+
+# FA.csv header, every column quoted (data rows are written without quotes)
+_FA_CSV_HEADER = (
+    "Country/Region name", "Country Name and Code", "Name of entity", "Address of entity", "ZIP Code",
+    "Nature of entity", "Date of acquiring the interest", "Initial value of the investment",
+    "Peak value of investment during the Period", "Closing balance",
+    "Total gross amount paid/credited with respect to the holding during the period", "Total gross proceeds from sale or redemption of investment during the period"
+)
+_FA_CSV_HEADER_LINE = ','.join(f'"{col}"' for col in _FA_CSV_HEADER) + '\n'
+
+# Yahoo Finance embeds the API crumb in the quote page
+CRUMB_PATTERN = re.compile(r'"CrumbStore":\{"crumb":"([^"]+)"\}')
+
+# Known details for common US stocks, used when Yahoo company info is unavailable
+_ENHANCED_COMPANY_DATA = MappingProxyType({
+    'AAPL': {
+        'name': 'Apple Inc.',
+        'address': 'One Apple Park Way Cupertino CA',
+        'zip_code': '95014',
+        'nature': 'Public Limited Company'
+    },
+    'MSFT': {
+        'name': 'Microsoft Corporation',
+        'address': 'One Microsoft Way Redmond WA',
+        'zip_code': '98052',
+        'nature': 'Public Limited Company'
+    },
+    'AMZN': {
+        'name': 'Amazon.com Inc.',
+        'address': '410 Terry Avenue North Seattle WA',
+        'zip_code': '98109',
+        'nature': 'Public Limited Company'
+    },
+    'GOOG': {
+        'name': 'Alphabet Inc.',
+        'address': '1600 Amphitheatre Parkway Mountain View CA',
+        'zip_code': '94043',
+        'nature': 'Public Limited Company'
+    },
+    'GOOGL': {
+        'name': 'Alphabet Inc.',
+        'address': '1600 Amphitheatre Parkway Mountain View CA',
+        'zip_code': '94043',
+        'nature': 'Public Limited Company'
+    },
+    'TSLA': {
+        'name': 'Tesla Inc.',
+        'address': '1 Tesla Road Austin TX',
+        'zip_code': '78725',
+        'nature': 'Public Limited Company'
+    },
+    'NVDA': {
+        'name': 'NVIDIA Corporation',
+        'address': '2788 San Tomas Expressway Santa Clara CA',
+        'zip_code': '95051',
+        'nature': 'Public Limited Company'
+    },
+    'META': {
+        'name': 'Meta Platforms Inc.',
+        'address': '1 Meta Way Menlo Park CA',
+        'zip_code': '94025',
+        'nature': 'Public Limited Company'
+    },
+    'UBER': {
+        'name': 'Uber Technologies Inc.',
+        'address': '1515 3rd Street San Francisco CA',
+        'zip_code': '94158',
+        'nature': 'Public Limited Company'
+    },
+    'SNAP': {
+        'name': 'Snap Inc.',
+        'address': '2772 Donald Douglas Loop North Santa Monica CA',
+        'zip_code': '90405',
+        'nature': 'Public Limited Company'
+    }
+})
+
 # Color codes for terminal output
 class Colors:
     RED = '\033[0;31m'
@@ -35,6 +148,20 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 class FACalculator:
+    # Read-only default; copy with dict() before storing it in public data
+    DEFAULT_COUNTRY_MAPPING = MappingProxyType({
+        "United States": 2,
+        "United Kingdom": 3,
+        "Canada": 4,
+        "Germany": 5,
+        "France": 6,
+        "Japan": 7,
+        "Australia": 8,
+        "Netherlands": 9,
+        "Switzerland": 10,
+        "Singapore": 11
+    })
+    
     def __init__(self, year: int, no_internet: bool = False, 
                  data_dir: str = None, verbose: bool = False,
                  exclude_validation: bool = False, no_sort: bool = False):
@@ -58,8 +185,26 @@ class FACalculator:
         self.fa_csv = self.data_dir / "FA.csv"
         
         # Configuration
-        self.fetch_delay_seconds = 0.1  # Minimal delay for better performance
+        self.fetch_delay_seconds = 0.1  # Minimum spacing of day-by-day price requests
         self.cache_update_interval = 10
+        self.max_fetch_workers = 8  # Concurrent Yahoo requests when prefetching prices
+        self.max_request_delay = 30.0  # Upper bound for the rate-limit backoff
+        
+        # Delay before the next Yahoo request, only non-zero after a 429; see _throttle().
+        # Prefetch threads update it concurrently, so it is guarded by a lock
+        self._request_delay = 0.0
+        self._request_delay_lock = threading.Lock()
+        
+        # Shared HTTP session so Yahoo requests reuse keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+        # Keep a pooled connection per prefetch worker and retry dropped connections;
+        # HTTP status codes (429 in particular) are still handled by the callers
+        retries = urllib3.util.Retry(total=2, backoff_factor=0.3, status_forcelist=())
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_fetch_workers, max_retries=retries)
+        self._session.mount('https://', adapter)
         
         # Tracking for cache updates
         self.fetched_data = {
@@ -67,6 +212,32 @@ class FACalculator:
             'exchange_rates': []
         }
         
+        # Number of cache changes not yet written to disk
+        self._dirty_count = 0
+        
+        # SBI reference rates by date, downloaded once per run on first cache miss
+        self._sbi_rates = None
+        self._sbi_latest_rate = None
+        
+        # Sales and sold share totals grouped by (symbol, purchase_date), see _index_sales()
+        self._sales_index = {}
+        self._shares_sold_index = {}
+        self._sales_index_source = None
+        
+        # The tax year's weekdays as YYYY-MM-DD strings, see _weekday_date_strs()
+        self._year_weekdays = None
+        
+        # Company info already resolved this run, see get_company_info()
+        self._company_info_memo = {}
+        
+        # Prices and SBI rates already resolved this run, see get_stock_price() and get_sbi_rate()
+        self._price_memo = {}
+        self._sbi_rate_memo = {}
+        
+        # Parsed vest.json and sell.json, see _load_vest() and _load_sell()
+        self._vest_data = None
+        self._sell_data = None
+        
         # Load existing data
         self.public_data = self.load_public_data()
     
@@ -83,8 +254,15 @@ class FACalculator:
         """Load existing public data from JSON file"""
         if self.public_data_file.exists():
             try:
-                with open(self.public_data_file, 'r') as f:
-                    return json.load(f)
+                raw = self.public_data_file.read_bytes()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                
+                # Give every stock all its sections once here, so saves don't have to
+                for stock_data in data.get("stocks", {}).values():
+                    stock_data.setdefault("prices", {})
+                    stock_data.setdefault("company_info", {})
+                    stock_data.setdefault("high_low", {})
+                return data
             except (json.JSONDecodeError, IOError) as e:
                 print(f"{Colors.YELLOW}⚠️  Warning: Could not load {self.public_data_file}: {e}{Colors.NC}")
         
@@ -92,53 +270,59 @@ class FACalculator:
         return {
             "stocks": {},
             "exchange_rates": {},
-            "country_mapping": {
-                "United States": 2,
-                "United Kingdom": 3,
-                "Canada": 4,
-                "Germany": 5,
-                "France": 6,
-                "Japan": 7,
-                "Australia": 8,
-                "Netherlands": 9,
-                "Switzerland": 10,
-                "Singapore": 11
-            }
+            "country_mapping": dict(self.DEFAULT_COUNTRY_MAPPING)
         }
     
     def save_public_data(self):
         """Save public data to JSON file with sorting"""
-        # Sort stocks alphabetically and dates chronologically
-        sorted_data = {
-            "stocks": {},
-            "exchange_rates": dict(sorted(self.public_data.get("exchange_rates", {}).items())),
-            "country_mapping": self.public_data.get("country_mapping", {
-                "United States": 2,
-                "United Kingdom": 3,
-                "Canada": 4,
-                "Germany": 5,
-                "France": 6,
-                "Japan": 7,
-                "Australia": 8,
-                "Netherlands": 9,
-                "Switzerland": 10,
-                "Singapore": 11
-            })
-        }
-        
-        # Sort stock data
-        for symbol in sorted(self.public_data.get("stocks", {}).keys()):
-            stock_data = self.public_data["stocks"][symbol]
-            sorted_data["stocks"][symbol] = {
-                "prices": dict(sorted(stock_data.get("prices", {}).items())),
-                "company_info": stock_data.get("company_info", {}),
-                "high_low": dict(sorted(stock_data.get("high_low", {}).items()))
-            }
+        # Make sure the top-level sections exist; sorting is left to the encoder
+        self.public_data.setdefault("stocks", {})
+        self.public_data.setdefault("exchange_rates", {})
+        if "country_mapping" not in self.public_data:
+            self.public_data["country_mapping"] = dict(self.DEFAULT_COUNTRY_MAPPING)
+        
+        # Stocks alphabetically and dates chronologically (keys sorted at every level)
+        if orjson:
+            payload = orjson.dumps(self.public_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(self.public_data, indent=2, sort_keys=True).encode()
         
-        with open(self.public_data_file, 'w') as f:
-            json.dump(sorted_data, f, indent=2)
+        self._replace_file(self.public_data_file, payload)
+        self._dirty_count = 0
+    
+    def _replace_file(self, path: Path, payload: bytes):
+        """Write payload to a temp file and rename it over path
         
-        self.public_data = sorted_data
+        An interrupted write never truncates the file, and a hard-linked file is
+        replaced rather than written through the link. The replacement keeps the
+        original file's permissions, and a failed write removes the temp file.
+        """
+        tmp_file = path.with_name(path.name + ".tmp")
+        try:
+            tmp_file.write_bytes(payload)
+            if path.exists():
+                shutil.copymode(path, tmp_file)
+            os.replace(tmp_file, path)
+        except BaseException:
+            try:
+                tmp_file.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+    
+    def _load_vest(self) -> Dict:
+        """Load vest.json once and reuse the parsed data"""
+        if self._vest_data is None:
+            raw = self.vest_file.read_bytes()
+            self._vest_data = orjson.loads(raw) if orjson else json.loads(raw)
+        return self._vest_data
+    
+    def _load_sell(self) -> Dict:
+        """Load sell.json once and reuse the parsed data"""
+        if self._sell_data is None:
+            raw = self.sell_file.read_bytes()
+            self._sell_data = orjson.loads(raw) if orjson else json.loads(raw)
+        return self._sell_data
     
     def validate_year(self) -> bool:
         """Validate the input year"""
@@ -158,15 +342,12 @@ class FACalculator:
         
         # Check if year is not less than earliest vest year
         try:
-            with open(self.vest_file, 'r') as f:
-                vest_data = json.load(f)
+            vest_data = self._load_vest()
             
-            earliest_year = None
-            for symbol_data in vest_data.values():
-                for vest in symbol_data.get("vests", []):
-                    vest_year = int(vest["vest_date"][:4])
-                    if earliest_year is None or vest_year < earliest_year:
-                        earliest_year = vest_year
+            earliest_year = min((int(vest["vest_date"][:4])
+                                 for symbol_data in vest_data.values()
+                                 for vest in symbol_data.get("vests", [])),
+                                default=None)
             
             if earliest_year is None:
                 print(f"{Colors.RED}❌ Error: No vest dates found in {self.vest_file}{Colors.NC}")
@@ -186,13 +367,24 @@ class FACalculator:
         return True
     
     def get_stock_price(self, symbol: str, date: str) -> Optional[float]:
-        """Get stock price for a symbol on a specific date"""
+        """Get stock price for a symbol on a specific date, resolved once per run"""
+        price = self._price_memo.get((symbol, date))
+        if price is None:
+            price = self._resolve_stock_price(symbol, date)
+            # Failures are not remembered so a later call can pick up a price cached since
+            if price is not None:
+                self._price_memo[(symbol, date)] = price
+        return price
+    
+    def _resolve_stock_price(self, symbol: str, date: str) -> Optional[float]:
+        """Get stock price from the cache or the internet"""
         # First, try to get price from cache
-        cached_price = (self.public_data.get("stocks", {})
-                       .get(symbol, {})
-                       .get("prices", {})
-                       .get(date))
+        try:
+            cached_price = self.public_data["stocks"][symbol]["prices"][date]
+        except KeyError:
+            cached_price = None
         
+        # Caches written by older versions hold prices as strings
         if cached_price is not None:
             return float(cached_price)
         
@@ -206,22 +398,23 @@ class FACalculator:
         # Fetch from internet
         self.vprint(f"{Colors.RED}🌐 FETCHING FROM INTERNET: {symbol} price for {date}{Colors.NC}")
         
-        # Try multiple approaches for getting stock price
-        for attempt in range(7):  # Try up to 7 days back for weekends/holidays
-            temp_date = datetime.strptime(date, "%Y-%m-%d") - timedelta(days=attempt)
-            temp_date_str = temp_date.strftime("%Y-%m-%d")
-            
-            # Skip weekends
-            if temp_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                continue
-            
-            price = self._fetch_yahoo_price(symbol, temp_date_str)
+        # Try up to 7 days back for weekends/holidays, preferring days already cached
+        cached_prices = self.public_data.get("stocks", {}).get(symbol, {}).get("prices", {})
+        for temp_date_str in self._recent_weekdays(date):
+            cached_price = cached_prices.get(temp_date_str)
+            from_cache = cached_price is not None
+            if from_cache:
+                price = float(cached_price)
+            else:
+                price = self._fetch_yahoo_price(symbol, temp_date_str)
             if price is not None:
                 formatted_price = round(price, 2)
-                self.vprint(f"{Colors.RED}✓ Successfully fetched {symbol} price: {formatted_price} for {temp_date_str}{Colors.NC}")
                 
-                # Cache for both the actual date found AND the original requested date
-                self._cache_stock_price(symbol, temp_date_str, formatted_price)
+                # Cache for both the actual date found AND the original requested date;
+                # a day that came from the cache only needs the requested date added
+                if not from_cache:
+                    self.vprint(f"{Colors.RED}✓ Successfully fetched {symbol} price: {formatted_price} for {temp_date_str}{Colors.NC}")
+                    self._cache_stock_price(symbol, temp_date_str, formatted_price)
                 if temp_date_str != date:
                     self._cache_stock_price(symbol, date, formatted_price)
                     self.vprint(f"{Colors.RED}✓ Caching {symbol} price {formatted_price} for original date {date} (using {temp_date_str} data){Colors.NC}")
@@ -235,10 +428,67 @@ class FACalculator:
         print(f"{Colors.RED}   Please try again later or check your internet connection{Colors.NC}")
         return None
     
+    def _recent_weekdays(self, date: str) -> List[str]:
+        """Return the date and the days up to 6 days before it, skipping weekends"""
+        start_day = datetime.fromisoformat(date).date()
+        weekday = start_day.weekday()
+        return [(start_day - timedelta(days=offset)).isoformat()
+                for offset in range(7) if (weekday - offset) % 7 < 5]  # Saturday = 5, Sunday = 6
+    
     def _fetch_yahoo_price(self, symbol: str, date: str) -> Optional[float]:
         """Fetch stock price for a specific date"""
         return self._fetch_single_day_price(symbol, date)
     
+    def prefetch_stock_prices(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[float]]:
+        """Fetch prices for several (symbol, date) pairs concurrently
+        
+        Only network I/O runs in worker threads; callers cache the results
+        from the main thread so public_data is never mutated concurrently.
+        """
+        if not pairs:
+            return {}
+        
+        workers = min(self.max_fetch_workers, len(pairs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            prices = executor.map(lambda pair: self._fetch_yahoo_price(*pair), pairs)
+            return dict(zip(pairs, prices))
+    
+    def prefetch_date_prices(self, dates_by_symbol: Dict[str, List[str]]) -> Dict[Tuple[str, str], Optional[float]]:
+        """Fetch prices for scattered dates with one range request per symbol
+        
+        A date without a trading day of its own takes the closest earlier one
+        within a week. Dates the range responses don't cover are fetched one
+        by one through prefetch_stock_prices.
+        """
+        if not dates_by_symbol:
+            return {}
+        
+        def fetch_range(symbol):
+            days = sorted(dates_by_symbol[symbol])
+            # Reach back far enough to look behind a weekend or holiday; period2 is exclusive
+            start = datetime.fromisoformat(days[0]) - timedelta(days=6)
+            end = datetime.fromisoformat(days[-1]) + timedelta(days=1)
+            return self._fetch_yahoo_week_data(symbol, start, end)
+        
+        symbols = list(dates_by_symbol)
+        workers = min(self.max_fetch_workers, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            range_prices = dict(zip(symbols, executor.map(fetch_range, symbols)))
+        
+        prices = {}
+        unresolved = []
+        for symbol, dates in dates_by_symbol.items():
+            price_data = range_prices[symbol] or {}
+            for date in dates:
+                price = next((price_data[day] for day in self._recent_weekdays(date) if day in price_data), None)
+                if price is None:
+                    unresolved.append((symbol, date))
+                else:
+                    prices[(symbol, date)] = price
+        
+        prices.update(self.prefetch_stock_prices(unresolved))
+        return prices
+    
     def get_purchase_price_with_vest_override(self, symbol: str, date: str, vest_data: dict) -> Optional[float]:
         """Get purchase price, using vest_price if available (already validated), otherwise fallback to market data"""
         
@@ -252,26 +502,43 @@ class FACalculator:
         # No vest_price provided, use regular market data
         return self.get_stock_price(symbol, date)
     
+    def _stock_entry(self, symbol: str) -> Dict:
+        """Return the cache entry for a symbol, creating it if needed"""
+        stocks = self.public_data.setdefault("stocks", {})
+        entry = stocks.get(symbol)
+        if entry is None:
+            entry = stocks[symbol] = {"prices": {}, "company_info": {}, "high_low": {}}
+        return entry
+    
+    def _stock_prices(self, symbol: str) -> Dict:
+        """Return the cached price dict for a symbol, creating the stock entry if needed"""
+        return self._stock_entry(symbol).setdefault("prices", {})
+    
     def _cache_stock_price(self, symbol: str, date: str, price: float):
         """Cache a stock price"""
-        if "stocks" not in self.public_data:
-            self.public_data["stocks"] = {}
-        if symbol not in self.public_data["stocks"]:
-            self.public_data["stocks"][symbol] = {"prices": {}, "company_info": {}}
-        if "prices" not in self.public_data["stocks"][symbol]:
-            self.public_data["stocks"][symbol]["prices"] = {}
-        
-        self.public_data["stocks"][symbol]["prices"][date] = f"{price:.2f}"
+        # Store the number itself, it is only formatted when written out
+        self._stock_prices(symbol)[date] = round(price, 2)
         
         # Track for batch updates
         self.fetched_data['stock_prices'].append({
             'symbol': symbol,
             'date': date,
-            'price': f"{price:.2f}"
+            'price': round(price, 2)
         })
+        
+        self._mark_cache_dirty()
     
     def get_sbi_rate(self, date: str) -> Optional[float]:
-        """Get SBI exchange rate for a specific date"""
+        """Get SBI exchange rate for a specific date, resolved once per run"""
+        rate = self._sbi_rate_memo.get(date)
+        if rate is None:
+            rate = self._resolve_sbi_rate(date)
+            if rate is not None:
+                self._sbi_rate_memo[date] = rate
+        return rate
+    
+    def _resolve_sbi_rate(self, date: str) -> Optional[float]:
+        """Get SBI exchange rate from the cache, the SBI reference table or the fallback table"""
         # First, try to get rate from cache
         cached_rate = self.public_data.get("exchange_rates", {}).get(date)
         
@@ -286,60 +553,23 @@ class FACalculator:
             return None
         
         # Fetch from internet (silent)
-        
-        try:
-            sbi_url = "https://raw.githubusercontent.com/sahilgupta/sbi-fx-ratekeeper/main/csv_files/SBI_REFERENCE_RATES_USD.csv"
-            
-            response = requests.get(sbi_url, timeout=30)
-            response.raise_for_status()
-            
-            # Try to find exact date match first
-            for line in response.text.split('\n'):
-                if line.startswith(date):
-                    parts = line.split(',')
-                    if len(parts) >= 4:
-                        try:
-                            rate = float(parts[3])  # TT SELL rate (column 4)
-                            if rate > 0:
-                                self._cache_exchange_rate(date, rate)
-                                return rate
-                        except ValueError:
-                            continue
-            
-            # Try previous dates (up to 10 days back)
-            for days_back in range(1, 11):
-                temp_date = datetime.strptime(date, "%Y-%m-%d") - timedelta(days=days_back)
-                temp_date_str = temp_date.strftime("%Y-%m-%d")
-                
-                for line in response.text.split('\n'):
-                    if line.startswith(temp_date_str):
-                        parts = line.split(',')
-                        if len(parts) >= 4:
-                            try:
-                                rate = float(parts[3])
-                                if rate > 0:
-                                    self._cache_exchange_rate(date, rate)
-                                    return rate
-                            except ValueError:
-                                continue
+        sbi_rates = self._load_sbi_rates()
+        if sbi_rates is not None:
+            # Try exact date first, then previous dates (up to 10 days back)
+            requested_date = datetime.fromisoformat(date)
+            for days_back in range(11):
+                temp_date_str = (requested_date - timedelta(days=days_back)).strftime("%Y-%m-%d")
+                rate = sbi_rates.get(temp_date_str)
+                if rate is not None:
+                    self._cache_exchange_rate(date, rate)
+                    return rate
             
             # Use most recent rate as fallback
-            lines = [line for line in response.text.split('\n') if line and not line.startswith('DATE')]
-            if lines:
-                last_line = lines[-1]
-                parts = last_line.split(',')
-                if len(parts) >= 4:
-                    try:
-                        rate = float(parts[3])
-                        if rate > 0:
-                            print(f"{Colors.RED}✓ Using most recent SBI rate for {date}: ₹{rate}{Colors.NC}")
-                            self._cache_exchange_rate(date, rate)
-                            return rate
-                    except ValueError:
-                        pass
-        
-        except requests.RequestException as e:
-            print(f"Error fetching SBI rate: {e}")
+            if self._sbi_latest_rate is not None:
+                rate = self._sbi_latest_rate
+                print(f"{Colors.RED}✓ Using most recent SBI rate for {date}: ₹{rate}{Colors.NC}")
+                self._cache_exchange_rate(date, rate)
+                return rate
         
         # Historical fallback based on year
         year = int(date[:4])
@@ -356,18 +586,53 @@ class FACalculator:
         self._cache_exchange_rate(date, fallback_rate)
         return fallback_rate
     
-    def _cache_exchange_rate(self, date: str, rate: float):
-        """Cache an exchange rate and save immediately"""
-        if "exchange_rates" not in self.public_data:
-            self.public_data["exchange_rates"] = {}
+    def _load_sbi_rates(self) -> Optional[Dict[str, float]]:
+        """Download the SBI reference rates once and index TT SELL rates by date"""
+        if self._sbi_rates is not None:
+            return self._sbi_rates
         
-        self.public_data["exchange_rates"][date] = f"{rate:.2f}"
+        rates = {}
+        try:
+            sbi_url = "https://raw.githubusercontent.com/sahilgupta/sbi-fx-ratekeeper/main/csv_files/SBI_REFERENCE_RATES_USD.csv"
+            
+            # Stream the CSV straight into csv.reader instead of holding the whole text and its lines
+            with self._session.get(sbi_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                for row in csv.reader(TextIOWrapper(response.raw, encoding='utf-8', newline='')):
+                    if len(row) < 4 or row[0].startswith('DATE'):
+                        continue
+                    try:
+                        rate = float(row[3])  # TT SELL rate (column 4)
+                    except ValueError:
+                        continue
+                    if rate > 0:
+                        # DATE column may carry a time suffix; keep the first rate seen per day
+                        rates.setdefault(row[0][:10], rate)
+                        self._sbi_latest_rate = rate
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            print(f"Error fetching SBI rate: {e}")
+            return None
         
-        # Save to file immediately
-        self._save_cache_silently()
+        self._sbi_rates = rates
+        return rates
+    
+    def _cache_exchange_rate(self, date: str, rate: float):
+        """Cache an exchange rate, saving once enough changes are pending"""
+        self.public_data.setdefault("exchange_rates", {})[date] = round(rate, 2)
+        
+        self._mark_cache_dirty()
     
     def get_company_info(self, symbol: str) -> Dict[str, str]:
-        """Get company information for a symbol"""
+        """Get company information for a symbol, resolved once per run"""
+        company_info = self._company_info_memo.get(symbol)
+        if company_info is None:
+            company_info = self._resolve_company_info(symbol)
+            self._company_info_memo[symbol] = company_info
+        return company_info
+    
+    def _resolve_company_info(self, symbol: str) -> Dict[str, str]:
+        """Get company information from the cache, the internet or the built-in table"""
         # First, try to get info from cache
         cached_info = (self.public_data.get("stocks", {})
                       .get(symbol, {})
@@ -404,10 +669,7 @@ class FACalculator:
         """Fetch company information from Yahoo Finance with proper authentication"""
         try:
             # First, get a crumb by visiting Yahoo Finance
-            session = requests.Session()
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
+            session = self._session
             
             # Get crumb from Yahoo Finance
             crumb_url = f"https://finance.yahoo.com/quote/{symbol}"
@@ -415,8 +677,7 @@ class FACalculator:
             crumb_response.raise_for_status()
             
             # Extract crumb from the page
-            import re
-            crumb_match = re.search(r'"CrumbStore":\{"crumb":"([^"]+)"\}', crumb_response.text)
+            crumb_match = CRUMB_PATTERN.search(crumb_response.text)
             if not crumb_match:
                 return None
             
@@ -428,7 +689,7 @@ class FACalculator:
             response = session.get(yahoo_url, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
             profile = data.get('quoteSummary', {}).get('result', [{}])[0].get('assetProfile', {})
             
             if profile:
@@ -474,76 +735,9 @@ class FACalculator:
     
     def _get_enhanced_company_info(self, symbol: str) -> Dict[str, str]:
         """Get enhanced company information with known details for common stocks"""
-        # Enhanced info for common US stocks
-        company_data = {
-            'AAPL': {
-                'name': 'Apple Inc.',
-                'address': 'One Apple Park Way Cupertino CA',
-                'zip_code': '95014',
-                'nature': 'Public Limited Company'
-            },
-            'MSFT': {
-                'name': 'Microsoft Corporation',
-                'address': 'One Microsoft Way Redmond WA',
-                'zip_code': '98052',
-                'nature': 'Public Limited Company'
-            },
-            'AMZN': {
-                'name': 'Amazon.com Inc.',
-                'address': '410 Terry Avenue North Seattle WA',
-                'zip_code': '98109',
-                'nature': 'Public Limited Company'
-            },
-            'GOOG': {
-                'name': 'Alphabet Inc.',
-                'address': '1600 Amphitheatre Parkway Mountain View CA',
-                'zip_code': '94043',
-                'nature': 'Public Limited Company'
-            },
-            'GOOGL': {
-                'name': 'Alphabet Inc.',
-                'address': '1600 Amphitheatre Parkway Mountain View CA',
-                'zip_code': '94043',
-                'nature': 'Public Limited Company'
-            },
-            'TSLA': {
-                'name': 'Tesla Inc.',
-                'address': '1 Tesla Road Austin TX',
-                'zip_code': '78725',
-                'nature': 'Public Limited Company'
-            },
-            'NVDA': {
-                'name': 'NVIDIA Corporation',
-                'address': '2788 San Tomas Expressway Santa Clara CA',
-                'zip_code': '95051',
-                'nature': 'Public Limited Company'
-            },
-            'META': {
-                'name': 'Meta Platforms Inc.',
-                'address': '1 Meta Way Menlo Park CA',
-                'zip_code': '94025',
-                'nature': 'Public Limited Company'
-            },
-            'UBER': {
-                'name': 'Uber Technologies Inc.',
-                'address': '1515 3rd Street San Francisco CA',
-                'zip_code': '94158',
-                'nature': 'Public Limited Company'
-            },
-            'SNAP': {
-                'name': 'Snap Inc.',
-                'address': '2772 Donald Douglas Loop North Santa Monica CA',
-                'zip_code': '90405',
-                'nature': 'Public Limited Company'
-            }
-        }
-        
-        if symbol in company_data:
-            info = company_data[symbol].copy()
-            info.update({
-                'country': 'United States'
-            })
-            return info
+        info = _ENHANCED_COMPANY_DATA.get(symbol)
+        if info:
+            return {**info, 'country': 'United States'}
         else:
             # Print error for unknown symbols and use sample info
             print(f"{Colors.RED}❌ ERROR: No company data available for {symbol}{Colors.NC}")
@@ -557,25 +751,41 @@ class FACalculator:
             }
     
     def _cache_company_info(self, symbol: str, info: Dict[str, str]):
-        """Cache company information and save immediately"""
-        if "stocks" not in self.public_data:
-            self.public_data["stocks"] = {}
-        if symbol not in self.public_data["stocks"]:
-            self.public_data["stocks"][symbol] = {"prices": {}, "company_info": {}}
+        """Cache company information, saved along with the next batch"""
+        self._stock_entry(symbol)["company_info"] = info
         
-        self.public_data["stocks"][symbol]["company_info"] = info
+        # Saved in batches, see _mark_cache_dirty()
+        self._mark_cache_dirty()
+    
+    def _get_lot_sales(self, sell_data: dict, symbol: str, vest_date: str) -> List[dict]:
+        """Get the sales of one vest lot, indexing sell_data by (symbol, purchase_date) once"""
+        self._index_sales(sell_data)
+        return self._sales_index.get((symbol, vest_date), [])
+    
+    def _get_lot_shares_sold(self, sell_data: dict, symbol: str, vest_date: str) -> int:
+        """Get the total number of shares sold from one vest lot"""
+        self._index_sales(sell_data)
+        return self._shares_sold_index.get((symbol, vest_date), 0)
+    
+    def _index_sales(self, sell_data: dict):
+        """Group sales and sold share totals by (symbol, purchase_date) in one pass over sell_data"""
+        if self._sales_index_source is sell_data:
+            return
         
-        # Save to file immediately
-        self._save_cache_silently()
+        sales_index = {}
+        shares_sold_index = {}
+        for sale_symbol, symbol_data in sell_data.items():
+            for sale in symbol_data.get("sales", []):
+                lot = (sale_symbol, sale.get("purchase_date"))
+                sales_index.setdefault(lot, []).append(sale)
+                shares_sold_index[lot] = shares_sold_index.get(lot, 0) + sale.get("number_of_shares_sold", 0)
+        self._sales_index = sales_index
+        self._shares_sold_index = shares_sold_index
+        self._sales_index_source = sell_data
     
     def validate_sales_and_get_remaining_shares(self, symbol: str, vest_date: str, original_shares: int, sell_data: dict) -> int:
         """Validate sales against vests and return remaining shares"""
-        symbol_sales = sell_data.get(symbol, {}).get("sales", [])
-        total_sold = 0
-        
-        for sale in symbol_sales:
-            if sale.get("purchase_date") == vest_date:
-                total_sold += sale.get("number_of_shares_sold", 0)
+        total_sold = self._get_lot_shares_sold(sell_data, symbol, vest_date)
         
         if total_sold > original_shares:
             print(f"{Colors.RED}❌ ERROR: Total sold shares ({total_sold}) exceeds original shares ({original_shares}) for {symbol} {vest_date}{Colors.NC}")
@@ -591,101 +801,87 @@ class FACalculator:
     def get_sale_proceeds_for_lot(self, symbol: str, vest_date: str) -> float:
         """Get total sale proceeds for a specific vest lot"""
         try:
-            with open(self.sell_file, 'r') as f:
-                sell_data = json.load(f)
+            sell_data = self._load_sell()
         except (FileNotFoundError, json.JSONDecodeError):
             return 0.0
         
-        symbol_sales = sell_data.get(symbol, {}).get("sales", [])
         total_proceeds = 0.0
         
-        for sale in symbol_sales:
-            if sale.get("purchase_date") == vest_date:
-                total_proceeds += sale.get("sell_price_inr", 0.0)
+        for sale in self._get_lot_sales(sell_data, symbol, vest_date):
+            total_proceeds += sale.get("sell_price_inr", 0.0)
         
         return total_proceeds
     
     def get_sale_proceeds_for_lot_in_year(self, symbol: str, vest_date: str, target_year: int, sell_data: dict) -> float:
         """Get total sale proceeds for a specific vest lot, but only for sales in the target year"""
-        symbol_sales = sell_data.get(symbol, {}).get("sales", [])
         total_proceeds = 0.0
+        year_prefix = str(target_year)
         
-        for sale in symbol_sales:
-            if sale.get("purchase_date") == vest_date:
-                sell_date = sale.get("sell_date", "")
-                # Only include sales from the target year
-                if sell_date.startswith(str(target_year)):
-                    total_proceeds += sale.get("sell_price_inr", 0.0)
+        for sale in self._get_lot_sales(sell_data, symbol, vest_date):
+            # Only include sales from the target year
+            if sale.get("sell_date", "").startswith(year_prefix):
+                total_proceeds += sale.get("sell_price_inr", 0.0)
         
         return total_proceeds
     
     def calculate_peak_value_with_sales(self, symbol: str, vest_date: str, original_shares: int, peak_price: float, peak_date: str, exchange_rate: float, sell_data: dict) -> float:
         """Calculate peak value by finding the date with highest (price × shares_held × exchange_rate)"""
-        from datetime import datetime, timedelta
-        
         # Get all sales for this vest lot in the target year
-        symbol_sales = sell_data.get(symbol, {}).get("sales", [])
         lot_sales = []
-        
-        for sale in symbol_sales:
-            if sale.get("purchase_date") == vest_date:
-                sell_date = sale.get("sell_date", "")
-                # Only consider sales in the target year
-                if sell_date.startswith(str(self.year)):
-                    lot_sales.append({
-                        "sell_date": sell_date,
-                        "shares_sold": sale.get("number_of_shares_sold", 0)
-                    })
+        year_prefix = str(self.year)
+        
+        for sale in self._get_lot_sales(sell_data, symbol, vest_date):
+            sell_date = sale.get("sell_date", "")
+            # Only consider sales in the target year
+            if sell_date.startswith(year_prefix):
+                lot_sales.append({
+                    "sell_date": sell_date,
+                    "shares_sold": sale.get("number_of_shares_sold", 0)
+                })
         
         # Sort sales by date
-        lot_sales.sort(key=lambda x: x["sell_date"])
-        
-        # Get the date range for peak calculation (from vest date to end of year)
-        vest_dt = datetime.strptime(vest_date, "%Y-%m-%d")
-        year_start = max(vest_dt, datetime(self.year, 1, 1))
-        year_end = datetime(self.year, 12, 31)
-        
-        # Get all stock prices for the symbol in the year
-        stock_data = self.public_data.get("stocks", {}).get(symbol, {})
-        year_prices = {}
-        
-        # Collect all available prices in the year range
-        for date_str, price in stock_data.get("prices", {}).items():
-            try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                if year_start <= date_obj <= year_end:
-                    year_prices[date_str] = price
-            except ValueError:
-                continue
+        lot_sales.sort(key=itemgetter("sell_date"))
+        
+        # Get the date range for peak calculation (from vest date to end of year);
+        # YYYY-MM-DD strings order like the dates themselves, so no parsing is needed
+        year_start = max(vest_date, f"{self.year}-01-01")
+        year_end = f"{self.year}-12-31"
+        
+        # Collect all available prices in the year range as parallel date/price lists,
+        # in date order: fetched days are appended to the cache unsorted, and max()
+        # below must keep the earliest of equal values
+        prices = self.public_data.get("stocks", {}).get(symbol, {}).get("prices", {})
+        year_dates = []
+        year_prices = []
+        for date_str in sorted(prices):
+            if year_start <= date_str <= year_end:
+                year_dates.append(date_str)
+                year_prices.append(float(prices[date_str]))
         
         if not year_prices:
             # Error out if daily prices are not available
             print(f"{Colors.RED}❌ ERROR: Daily price data not available for {symbol} in {self.year}. Cannot calculate accurate peak value.{Colors.NC}")
             return None
         
-        # Find the date with maximum (price × shares_held) in USD first
-        max_usd_value = 0.0
-        best_date = None
-        
-        for date_str, price in year_prices.items():
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            
-            # Calculate shares held on this date
-            shares_held = original_shares
-            for sale in lot_sales:
-                sale_date_obj = datetime.strptime(sale["sell_date"], "%Y-%m-%d")
-                if sale_date_obj <= date_obj:
-                    shares_held -= sale["shares_sold"]
-            
-            shares_held = max(0, shares_held)
-            
-            if shares_held > 0:
-                # Calculate total USD value on this date (no exchange rate yet)
-                usd_value = float(price) * shares_held
-                
-                if usd_value > max_usd_value:
-                    max_usd_value = usd_value
-                    best_date = date_str
+        # Keep a running total of shares sold, so the shares held on any date
+        # is a binary search instead of a scan of all sales
+        sale_dates = [sale["sell_date"] for sale in lot_sales]
+        cum_sold = list(accumulate(sale["shares_sold"] for sale in lot_sales))
+        
+        def usd_values():
+            """Yield (date, price × shares_held) in USD for dates with shares still held"""
+            for date_str, price in zip(year_dates, year_prices):
+                sales_so_far = bisect_right(sale_dates, date_str)
+                sold = cum_sold[sales_so_far - 1] if sales_so_far else 0
+                shares_held = original_shares - sold
+                if shares_held > 0:
+                    yield date_str, price * shares_held
+        
+        # Find the date with maximum (price × shares_held) in USD first;
+        # max() keeps the first of several equal values
+        best_date, max_usd_value = max(usd_values(), key=itemgetter(1), default=(None, 0.0))
+        if max_usd_value <= 0:
+            best_date = None
         
         if best_date is None:
             print(f"{Colors.RED}❌ ERROR: No valid peak date found for {symbol} {vest_date}. All shares may have been sold.{Colors.NC}")
@@ -705,7 +901,7 @@ class FACalculator:
     def get_peak_price_from_vest(self, symbol: str, vest_date: str) -> tuple:
         """Get peak price and date from vest date onwards within the tax year"""
         # Determine start and end dates for peak calculation
-        vest_dt = datetime.strptime(vest_date, "%Y-%m-%d")
+        vest_dt = datetime.fromisoformat(vest_date)
         year_start = datetime(self.year, 1, 1)
         year_end = datetime(self.year, 12, 31)
         
@@ -719,7 +915,7 @@ class FACalculator:
         cached_days = self._count_cached_days(symbol, start_date, end_date)
         
         if cached_days < expected_days * 0.8:
-            self.vprint(f"📊 Insufficient cached data ({cached_days}/{expected_days} days). Fetching day-by-day...")
+            self.vprint(f"📊 Insufficient cached data ({cached_days}/{expected_days} days). Fetching the period...")
             if self.no_internet:
                 print(f"{Colors.RED}❌ ERROR: Insufficient cached data for peak calculation{Colors.NC}")
                 print(f"{Colors.RED}   --no-internet mode enabled, cannot fetch missing data{Colors.NC}")
@@ -727,33 +923,53 @@ class FACalculator:
                 return None, None
             self._fetch_year_data(symbol, start_date, end_date)
         
-        # Calculate peak from cached data
-        peak_price = 0.0
-        peak_date = None
-        current_date = start_date
-        
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Skip weekends
-                date_str = current_date.strftime("%Y-%m-%d")
-                price = self.get_stock_price(symbol, date_str)
-                if price and price > peak_price:
-                    peak_price = price
-                    peak_date = date_str
-            
-            current_date += timedelta(days=1)
+        # Calculate peak from cached data; weekdays come in date order, so max() keeps the earliest peak
+        cached_prices = self.public_data.get("stocks", {}).get(symbol, {}).get("prices", {})
+        weekday_prices = ((date_str, float(cached_prices[date_str]))
+                          for date_str in self._weekday_date_strs(start_date, end_date)
+                          if date_str in cached_prices)
+        peak_date, peak_price = max(((date_str, price) for date_str, price in weekday_prices if price > 0),
+                                    key=itemgetter(1), default=(None, 0.0))
         
         self.vprint(f"📈 Peak price for {symbol}: ${peak_price:.2f} on {peak_date}")
         return peak_price, peak_date
     
     def _count_trading_days(self, start_date: datetime, end_date: datetime) -> int:
         """Count expected trading days between two dates"""
-        count = 0
-        current = start_date
-        while current <= end_date:
-            if current.weekday() < 5:  # Monday=0, Friday=4
-                count += 1
-            current += timedelta(days=1)
-        return count
+        total_days = (end_date - start_date).days + 1
+        if total_days <= 0:
+            return 0
+        
+        # Five weekdays in every full week, then check the leftover days
+        full_weeks, extra_days = divmod(total_days, 7)
+        start_weekday = start_date.weekday()
+        return full_weeks * 5 + sum(1 for i in range(extra_days) if (start_weekday + i) % 7 < 5)  # Monday=0, Friday=4
+    
+    def _weekday_date_strs(self, start_date: datetime, end_date: datetime) -> List[str]:
+        """List the weekday dates between two dates as YYYY-MM-DD strings"""
+        # Periods inside the tax year are slices of the year's list, built once per run
+        if start_date.year == end_date.year == self.year:
+            if self._year_weekdays is None:
+                self._year_weekdays = self._build_weekday_date_strs(datetime(self.year, 1, 1), datetime(self.year, 12, 31))
+            start_str = start_date.strftime("%Y-%m-%d")
+            end_str = end_date.strftime("%Y-%m-%d")
+            return self._year_weekdays[bisect_left(self._year_weekdays, start_str):bisect_right(self._year_weekdays, end_str)]
+        return self._build_weekday_date_strs(start_date, end_date)
+    
+    def _build_weekday_date_strs(self, start_date: datetime, end_date: datetime) -> List[str]:
+        """Walk the dates between two dates and keep the weekdays as YYYY-MM-DD strings"""
+        # Ordinal 1 (0001-01-01) is a Monday, so (ordinal - 1) % 7 is the weekday
+        ordinal = start_date.toordinal()
+        end_ordinal = end_date.toordinal()
+        weekday = (ordinal - 1) % 7
+        if weekday > 4:
+            ordinal += 7 - weekday  # Start on the following Monday
+        
+        dates = []
+        while ordinal <= end_ordinal:
+            dates.append(date.fromordinal(ordinal).isoformat())
+            ordinal += 3 if (ordinal - 1) % 7 == 4 else 1  # Friday jumps straight to Monday
+        return dates
     
     def _count_cached_days(self, symbol: str, start_date: datetime, end_date: datetime) -> int:
         """Count cached trading days for a symbol between two dates"""
@@ -761,15 +977,7 @@ class FACalculator:
                         .get(symbol, {})
                         .get("prices", {}))
         
-        count = 0
-        current = start_date
-        while current <= end_date:
-            if current.weekday() < 5:  # Skip weekends
-                date_str = current.strftime("%Y-%m-%d")
-                if date_str in cached_prices:
-                    count += 1
-            current += timedelta(days=1)
-        return count
+        return len(set(self._weekday_date_strs(start_date, end_date)) & cached_prices.keys())
     
     def _count_missing_prices(self, symbol: str, start_date: datetime, end_date: datetime) -> int:
         """Count how many prices need to be fetched for the given period"""
@@ -777,15 +985,7 @@ class FACalculator:
                         .get(symbol, {})
                         .get("prices", {}))
         
-        count = 0
-        current = start_date
-        while current <= end_date:
-            if current.weekday() < 5:  # Skip weekends
-                date_str = current.strftime("%Y-%m-%d")
-                if date_str not in cached_prices:
-                    count += 1
-            current += timedelta(days=1)
-        return count
+        return len(set(self._weekday_date_strs(start_date, end_date)) - cached_prices.keys())
     
     def _fetch_stock_price_silently(self, symbol: str, date: str) -> Optional[float]:
         """Fetch stock price without verbose messaging (for bulk operations)"""
@@ -793,28 +993,22 @@ class FACalculator:
         if self.no_internet:
             return None
         
-        # Try multiple approaches for getting stock price
-        for attempt in range(7):  # Try up to 7 days back for weekends/holidays
-            temp_date = datetime.strptime(date, "%Y-%m-%d") - timedelta(days=attempt)
-            temp_date_str = temp_date.strftime("%Y-%m-%d")
-            
-            # Skip weekends
-            if temp_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                continue
-            
-            price = self._fetch_yahoo_price(symbol, temp_date_str)
+        # Try up to 7 days back for weekends/holidays, preferring days already cached
+        cached_prices = self.public_data.get("stocks", {}).get(symbol, {}).get("prices", {})
+        for temp_date_str in self._recent_weekdays(date):
+            cached_price = cached_prices.get(temp_date_str)
+            if cached_price is not None:
+                price = float(cached_price)
+            else:
+                price = self._fetch_yahoo_price(symbol, temp_date_str)
             if price is not None:
                 formatted_price = round(price, 2)
                 
                 # Cache both the original date and the actual trading date
-                if symbol not in self.public_data["stocks"]:
-                    self.public_data["stocks"][symbol] = {"prices": {}}
-                if "prices" not in self.public_data["stocks"][symbol]:
-                    self.public_data["stocks"][symbol]["prices"] = {}
-                
-                self.public_data["stocks"][symbol]["prices"][date] = formatted_price
+                prices = self._stock_prices(symbol)
+                prices[date] = formatted_price
                 if temp_date_str != date:
-                    self.public_data["stocks"][symbol]["prices"][temp_date_str] = formatted_price
+                    prices[temp_date_str] = formatted_price
                 
                 # Add to batch for incremental updates
                 self.fetched_data['stock_prices'].append({
@@ -837,14 +1031,9 @@ class FACalculator:
         """Fetch stock price for a single day using JSON API"""
         try:
             # Convert date to timestamp
-            dt = datetime.strptime(date, "%Y-%m-%d")
-            timestamp = int(dt.timestamp())
+            timestamp, day_end = _day_bounds(date)
             end_timestamp = timestamp + 86400
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0'
-            }
-            
             # Try multiple Yahoo Finance JSON endpoints
             endpoints = [
                 f"https://query2.finance.yahoo.com/v8/finance/chart/{symbol}?period1={timestamp}&period2={end_timestamp}&interval=1d",
@@ -853,16 +1042,19 @@ class FACalculator:
             
             for endpoint in endpoints:
                 try:
-                    response = requests.get(endpoint, headers=headers, timeout=10)
+                    self._throttle()
+                    response = self._session.get(endpoint, headers=_CHART_HEADERS, timeout=10)
                     
                     if response.status_code == 404:
                         continue  # Try next endpoint
                     elif response.status_code == 429:
+                        self._note_rate_limited(response)
                         print(f"⚠️  Rate limited, skipping this request...")
                         return None  # Skip instead of waiting
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        self._note_request_ok()
+                        data = orjson.loads(response.content) if orjson else response.json()
                         
                         # Check if we have valid data
                         if not data.get('chart') or not data['chart'].get('result'):
@@ -872,18 +1064,18 @@ class FACalculator:
                         
                         # Get timestamps to match exact date
                         timestamps = result.get('timestamp', [])
-                        target_date = date  # YYYY-MM-DD format
                         
                         # Extract close price
                         if 'indicators' in result and result['indicators'].get('quote'):
                             quotes = result['indicators']['quote'][0]
                             if 'close' in quotes and quotes['close']:
                                 close_prices = quotes['close']
-                                # Find close price that matches the exact date
-                                for i in range(len(timestamps)):
-                                    api_date = datetime.fromtimestamp(timestamps[i]).strftime("%Y-%m-%d")
-                                    if api_date == target_date and i < len(close_prices) and close_prices[i] is not None:
-                                        return round(float(close_prices[i]), 2)
+                                # Find the close price stamped within the requested (local) day
+                                for ts, close_price in zip(timestamps, close_prices):
+                                    if ts >= day_end:
+                                        break  # Timestamps are ascending
+                                    if ts >= timestamp and close_price is not None:
+                                        return round(float(close_price), 2)
                         
                         # Try alternative data structure
                         if 'meta' in result and 'regularMarketPrice' in result['meta']:
@@ -903,56 +1095,84 @@ class FACalculator:
         
         return None
     
-    def _fetch_year_data(self, symbol: str, start_date: datetime, end_date: datetime) -> bool:
-        """Fetch daily stock prices for the entire period day by day"""
-        self.vprint(f"📅 Fetching {symbol} data day by day...")
+    def _fetch_year_data(self, symbol: str, start_date: datetime, end_date: datetime, price_data: Optional[dict] = None) -> bool:
+        """Fetch daily stock prices for the entire period in one range request
+        
+        price_data is a range response already fetched by prefetch_year_data().
+        """
+        self.vprint(f"📅 Fetching {symbol} data for {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}...")
         
         # Check if no-internet mode is enabled
         if self.no_internet:
             return False
         
-        current_date = start_date
+        if price_data is None:
+            # period2 is exclusive, so ask for one day past the end date
+            price_data = self._fetch_yahoo_week_data(symbol, start_date, end_date + timedelta(days=1))
+        if not price_data:
+            self.vprint(f"⚠️  Range request for {symbol} returned no prices, fetching day by day...")
+            return self._fetch_days_individually(symbol, start_date, end_date)
+        
+        cached_prices = self._stock_prices(symbol)
+        
+        # Days missing from a successful response are market holidays, don't fetch them again
+        start_str = start_date.strftime("%Y-%m-%d")
+        end_str = end_date.strftime("%Y-%m-%d")
+        new_prices = {date_str: price for date_str, price in price_data.items()
+                      if start_str <= date_str <= end_str and date_str not in cached_prices}
+        if not new_prices:
+            return False
+        
+        cached_prices.update(new_prices)
+        self._save_cache_silently()
+        return True
+    
+    def prefetch_year_data(self, symbols: List[str], start_date: datetime, end_date: datetime) -> Dict[str, dict]:
+        """Run the range request of _fetch_year_data for several symbols concurrently
+        
+        Like prefetch_stock_prices, only network I/O runs in worker threads.
+        """
+        if not symbols:
+            return {}
+        
+        range_end = end_date + timedelta(days=1)
+        workers = min(self.max_fetch_workers, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda symbol: self._fetch_yahoo_week_data(symbol, start_date, range_end), symbols)
+            return dict(zip(symbols, results))
+    
+    def _fetch_days_individually(self, symbol: str, start_date: datetime, end_date: datetime) -> bool:
+        """Fetch daily stock prices for the entire period day by day"""
         fetch_count = 0
         total_cached = 0
-        
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Skip weekends
-                date_str = current_date.strftime("%Y-%m-%d")
+        missing_total = self._count_missing_prices(symbol, start_date, end_date)
+        cached_prices = self._stock_prices(symbol)
+        
+        for date_str in self._weekday_date_strs(start_date, end_date):
+            if date_str not in cached_prices:
+                if fetch_count:
+                    # Space out the day requests; _throttle() only slows down after a 429
+                    time.sleep(self.fetch_delay_seconds)
                 
-                # Check if already cached
-                cached_price = (self.public_data.get("stocks", {})
-                               .get(symbol, {})
-                               .get("prices", {})
-                               .get(date_str))
+                # Show progress every 10 fetches
+                if fetch_count % 10 == 0:
+                    self.vprint(f"📅 {symbol}: Fetching prices... ({fetch_count + 1}/{missing_total})")
                 
-                if cached_price is None:
-                    # Show progress every 10 fetches
-                    if fetch_count % 10 == 0:
-                        missing_total = self._count_missing_prices(symbol, start_date, end_date)
-                        self.vprint(f"📅 {symbol}: Fetching prices... ({fetch_count + 1}/{missing_total})")
-                    
-                    # Fetch single day price using JSON API
-                    price = self._fetch_single_day_price(symbol, date_str)
-                    
-                    if price is not None:
-                        # Cache the price immediately
-                        if symbol not in self.public_data["stocks"]:
-                            self.public_data["stocks"][symbol] = {"prices": {}}
-                        if "prices" not in self.public_data["stocks"][symbol]:
-                            self.public_data["stocks"][symbol]["prices"] = {}
-                        
-                        self.public_data["stocks"][symbol]["prices"][date_str] = price
-                        total_cached += 1
-                        
-                        # Save to file immediately (silent update)
-                        self._save_cache_silently()
-                    
-                    fetch_count += 1
+                # Fetch single day price using JSON API
+                price = self._fetch_single_day_price(symbol, date_str)
+                
+                if price is not None:
+                    # Cache the price immediately
+                    cached_prices[date_str] = price
+                    total_cached += 1
                     
-                    # 1 second delay between requests (faster like shell script)
-                    time.sleep(1)
-            
-            current_date += timedelta(days=1)
+                    # Saved in batches, see _mark_cache_dirty()
+                    self._mark_cache_dirty()
+                
+                fetch_count += 1
+        
+        # Write out whatever the last partial batch left pending
+        self._flush_cache()
         
         if total_cached > 0:
             return True
@@ -961,23 +1181,12 @@ class FACalculator:
     
     
     def _fetch_yahoo_week_data(self, symbol: str, start_date: datetime, end_date: datetime) -> dict:
-        """Fetch one week of stock prices in one API call"""
+        """Fetch stock prices for a date range (end date exclusive) in one API call"""
         try:
             # Convert dates to timestamps
             start_timestamp = int(start_date.timestamp())
             end_timestamp = int(end_date.timestamp())
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'application/json, text/plain, */*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://finance.yahoo.com/',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache'
-            }
-            
             # Try multiple Yahoo Finance endpoints for week data
             endpoints = [
                 f"https://query2.finance.yahoo.com/v8/finance/chart/{symbol}?period1={start_timestamp}&period2={end_timestamp}&interval=1d",
@@ -986,20 +1195,21 @@ class FACalculator:
             
             for endpoint in endpoints:
                 try:
-                    # Delay to avoid rate limiting
-                    time.sleep(0.5)
-                    response = requests.get(endpoint, headers=headers, timeout=30)
+                    self._throttle()
+                    response = self._session.get(endpoint, headers=_RANGE_HEADERS, timeout=30)
                     
                     if response.status_code == 404:
                         continue  # Try next endpoint
                     elif response.status_code == 429:
-                        print(f"⚠️  Rate limited for {symbol}, waiting 5 seconds...")
-                        time.sleep(5)
+                        wait = self._note_rate_limited(response)
+                        print(f"⚠️  Rate limited for {symbol}, waiting {wait:g} seconds...")
+                        time.sleep(wait)
                         # Retry once more
-                        response = requests.get(endpoint, headers=headers, timeout=30)
+                        response = self._session.get(endpoint, headers=_RANGE_HEADERS, timeout=30)
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        self._note_request_ok()
+                        data = orjson.loads(response.content) if orjson else response.json()
                         
                         # Check if we have valid data
                         if not data.get('chart') or not data['chart'].get('result'):
@@ -1017,10 +1227,9 @@ class FACalculator:
                                 
                                 # Build date -> price mapping
                                 price_data = {}
-                                for i, timestamp in enumerate(timestamps):
-                                    if i < len(close_prices) and close_prices[i] is not None:
-                                        date_str = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')
-                                        price_data[date_str] = round(float(close_prices[i]), 2)
+                                for timestamp, close_price in zip(timestamps, close_prices):
+                                    if close_price is not None:
+                                        price_data[date.fromtimestamp(timestamp).isoformat()] = round(float(close_price), 2)
                                 
                                 return price_data
                         
@@ -1028,8 +1237,9 @@ class FACalculator:
                     if hasattr(e, 'response') and e.response:
                         status_code = e.response.status_code
                         if status_code == 429:
-                            print(f"⚠️  Rate limited for {symbol}, waiting 5 seconds...")
-                            time.sleep(5)
+                            wait = self._note_rate_limited(e.response)
+                            print(f"⚠️  Rate limited for {symbol}, waiting {wait:g} seconds...")
+                            time.sleep(wait)
                         elif status_code != 404:
                             print(f"⚠️  API error for {symbol}: {status_code}")
                     continue
@@ -1041,6 +1251,30 @@ class FACalculator:
         
         return {}
     
+    def _throttle(self):
+        """Wait before a Yahoo request only while backing off from rate limiting"""
+        with self._request_delay_lock:
+            delay = self._request_delay
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _note_rate_limited(self, response) -> float:
+        """Back off after a 429, honouring Retry-After when present; returns the wait"""
+        retry_after = response.headers.get('Retry-After', '')
+        with self._request_delay_lock:
+            if retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = max(1.0, self._request_delay * 2)
+            self._request_delay = min(delay, self.max_request_delay)
+            return self._request_delay
+    
+    def _note_request_ok(self):
+        """Ease off the backoff after a successful request"""
+        with self._request_delay_lock:
+            if self._request_delay > 0:
+                self._request_delay = self._request_delay / 2 if self._request_delay > 0.1 else 0.0
+    
     def _save_cache_silently(self):
         """Save cache to file without any messages"""
         try:
@@ -1048,6 +1282,17 @@ class FACalculator:
         except Exception:
             pass  # Silent failure, don't interrupt the main process
     
+    def _mark_cache_dirty(self):
+        """Record a cache change and save every cache_update_interval changes"""
+        self._dirty_count += 1
+        if self._dirty_count >= self.cache_update_interval:
+            self._save_cache_silently()
+    
+    def _flush_cache(self):
+        """Save the cache if there are changes not yet written"""
+        if self._dirty_count:
+            self._save_cache_silently()
+    
     def update_incremental_cache(self):
         """Update cache incrementally with fetched stock prices"""
         if not self.fetched_data['stock_prices']:
@@ -1063,32 +1308,23 @@ class FACalculator:
     
     def _filter_zero_shares(self, data: Dict, data_type: str) -> Dict:
         """Filter out entries with 0 shares and print warnings"""
-        filtered_data = {}
+        if data_type == "vest":
+            list_key, shares_key, date_key, label = "vests", "number_of_shares", "vest_date", "vest"
+        else:
+            list_key, shares_key, date_key, label = "sales", "number_of_shares_sold", "sell_date", "sale"
         
+        filtered_data = {}
         for symbol, symbol_data in data.items():
-            filtered_symbol_data = {"vests": [], "sales": []}
-            
-            if data_type == "vest":
-                # Filter vests with 0 shares
-                for vest in symbol_data.get("vests", []):
-                    shares = vest.get("number_of_shares", 0)
-                    if shares == 0:
-                        print(f"{Colors.RED}⚠️  Warning: Ignoring {symbol} vest on {vest.get('vest_date', 'unknown date')} - 0 shares{Colors.NC}")
-                    else:
-                        filtered_symbol_data["vests"].append(vest)
-            
-            elif data_type == "sell":
-                # Filter sales with 0 shares
-                for sale in symbol_data.get("sales", []):
-                    shares = sale.get("number_of_shares_sold", 0)
-                    if shares == 0:
-                        print(f"{Colors.RED}⚠️  Warning: Ignoring {symbol} sale on {sale.get('sell_date', 'unknown date')} - 0 shares{Colors.NC}")
-                    else:
-                        filtered_symbol_data["sales"].append(sale)
+            kept = []
+            for entry in symbol_data.get(list_key, []):
+                if entry.get(shares_key, 0) == 0:
+                    print(f"{Colors.RED}⚠️  Warning: Ignoring {symbol} {label} on {entry.get(date_key, 'unknown date')} - 0 shares{Colors.NC}")
+                else:
+                    kept.append(entry)
             
             # Only include symbol if it has non-zero entries
-            if filtered_symbol_data["vests"] or filtered_symbol_data["sales"]:
-                filtered_data[symbol] = filtered_symbol_data
+            if kept:
+                filtered_data[symbol] = {list_key: kept}
         
         return filtered_data
     
@@ -1098,16 +1334,14 @@ class FACalculator:
         
         # Load vest data
         try:
-            with open(self.vest_file, 'r') as f:
-                vest_data = json.load(f)
+            vest_data = self._load_vest()
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"{Colors.RED}❌ Error reading {self.vest_file}: {e}{Colors.NC}")
             return None
         
         # Load sell data
         try:
-            with open(self.sell_file, 'r') as f:
-                sell_data = json.load(f)
+            sell_data = self._load_sell()
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"{Colors.RED}❌ Error reading {self.sell_file}: {e}{Colors.NC}")
             return None
@@ -1120,6 +1354,12 @@ class FACalculator:
         
         self.vprint("🔍 Validating sales against vest lots...")
         
+        # Index vests by (symbol, vest_date); the first vest listed for a date wins
+        vest_index = {}
+        for symbol, symbol_data in vest_data.items():
+            for vest in symbol_data.get("vests", []):
+                vest_index.setdefault((symbol, vest["vest_date"]), vest)
+        
         # Validate all sales against vests
         all_valid = True
         for symbol, symbol_data in sell_data.items():
@@ -1134,17 +1374,12 @@ class FACalculator:
                     all_valid = False
                 
                 # Find matching vest
-                vest_found = False
-                if symbol in vest_data:
-                    for vest in vest_data[symbol].get("vests", []):
-                        if vest["vest_date"] == vest_date:
-                            if vest["number_of_shares"] < shares_sold:
-                                print(f"{Colors.RED}❌ Invalid sale: {symbol} {vest_date} - trying to sell {shares_sold} shares but only {vest['number_of_shares']} available{Colors.NC}")
-                                all_valid = False
-                            vest_found = True
-                            break
-                
-                if not vest_found:
+                vest = vest_index.get((symbol, vest_date))
+                if vest is not None:
+                    if vest["number_of_shares"] < shares_sold:
+                        print(f"{Colors.RED}❌ Invalid sale: {symbol} {vest_date} - trying to sell {shares_sold} shares but only {vest['number_of_shares']} available{Colors.NC}")
+                        all_valid = False
+                else:
                     print(f"{Colors.RED}❌ Invalid sale: {symbol} {vest_date} - no matching vest found{Colors.NC}")
                     all_valid = False
         
@@ -1228,58 +1463,59 @@ class FACalculator:
             symbol_specific_dates[symbol] = symbol_dates
         
         # Fetch calculation year data for peak calculation (efficient bulk fetch)
+        start_date = datetime(self.year, 1, 1)
+        end_date = datetime(self.year, 12, 31)
+        symbols_to_fetch = []
         for symbol in required_symbols:
-            start_date = datetime(self.year, 1, 1)
-            end_date = datetime(self.year, 12, 31)
-            
             self.vprint(f"📊 Preparing to fetch {symbol} data for peak calculation ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')})")
             missing_count = self._count_missing_prices(symbol, start_date, end_date)
             if missing_count > 0:
                 self.vprint(f"🌐 Need to fetch {missing_count} missing prices for {symbol}")
-                success = self._fetch_year_data(symbol, start_date, end_date)
-                if not success and not self.no_internet:
-                    print(f"⚠️  Failed to fetch {symbol} data for peak calculation")
+                symbols_to_fetch.append(symbol)
             else:
                 self.vprint(f"✓ {symbol} data already cached")
         
+        # Request every symbol's year at once, then merge the responses one by one
+        range_prices = {} if self.no_internet else self.prefetch_year_data(symbols_to_fetch, start_date, end_date)
+        for symbol in symbols_to_fetch:
+            success = self._fetch_year_data(symbol, start_date, end_date, range_prices.get(symbol))
+            if not success and not self.no_internet:
+                print(f"⚠️  Failed to fetch {symbol} data for peak calculation")
+        
         # Fetch specific required dates that are not in the calculation year
         self.vprint("📅 Fetching specific required dates...")
+        missing_by_symbol = {}
+        missing_pairs = []
         for symbol, dates in symbol_specific_dates.items():
-            missing_dates = []
-            for date in dates:
-                # Check if date is already cached
-                cached_price = (self.public_data.get("stocks", {})
-                               .get(symbol, {})
-                               .get("prices", {})
-                               .get(date))
-                if cached_price is None:
-                    missing_dates.append(date)
+            cached_prices = self.public_data.get("stocks", {}).get(symbol, {}).get("prices", {})
+            missing_dates = [date for date in dates if cached_prices.get(date) is None]
             
             if missing_dates:
                 self.vprint(f"🌐 Fetching {len(missing_dates)} missing dates for {symbol}: {missing_dates}")
-                
-                # Group dates by proximity and fetch in small ranges
-                for date in missing_dates:
-                    if self.no_internet:
-                        print(f"{Colors.RED}❌ ERROR: Missing price for {symbol} on {date}{Colors.NC}")
-                        print(f"{Colors.RED}   --no-internet mode enabled, cannot fetch from internet{Colors.NC}")
-                        return False
-                    
-                    # Use the efficient _fetch_yahoo_price method (which now uses bulk fetch)
-                    price = self._fetch_yahoo_price(symbol, date)
-                    if price is not None:
-                        # Cache the price
-                        if symbol not in self.public_data["stocks"]:
-                            self.public_data["stocks"][symbol] = {"prices": {}}
-                        if "prices" not in self.public_data["stocks"][symbol]:
-                            self.public_data["stocks"][symbol]["prices"] = {}
-                        
-                        self.public_data["stocks"][symbol]["prices"][date] = round(price, 2)
-                        self._save_cache_silently()
-                        print(f"✅ Cached {symbol} price for {date}: ${price}")
-                    else:
-                        print(f"❌ Failed to fetch {symbol} price for {date}")
-                        return False
+                missing_by_symbol[symbol] = missing_dates
+                missing_pairs.extend((symbol, date) for date in missing_dates)
+        
+        if missing_pairs:
+            if self.no_internet:
+                symbol, date = missing_pairs[0]
+                print(f"{Colors.RED}❌ ERROR: Missing price for {symbol} on {date}{Colors.NC}")
+                print(f"{Colors.RED}   --no-internet mode enabled, cannot fetch from internet{Colors.NC}")
+                return False
+            
+            # One range request per symbol covers its missing dates, then cache them in order
+            fetched_prices = self.prefetch_date_prices(missing_by_symbol)
+            for symbol, date in missing_pairs:
+                price = fetched_prices[(symbol, date)]
+                if price is not None:
+                    # Cache the price
+                    self._stock_prices(symbol)[date] = round(price, 2)
+                    print(f"✅ Cached {symbol} price for {date}: ${price}")
+                else:
+                    print(f"❌ Failed to fetch {symbol} price for {date}")
+                    self._save_cache_silently()
+                    return False
+            
+            self._save_cache_silently()
         
         # Fetch company info for all symbols
         self.vprint("📋 Fetching company information...")
@@ -1287,13 +1523,16 @@ class FACalculator:
             company_info = self.get_company_info(symbol)
             if company_info is None and self.no_internet:
                 return False
+        self._flush_cache()
         
         # Fetch exchange rates for all required dates
         self.vprint("💱 Fetching exchange rates...")
         exchange_rates_fetched = 0
-        initial_exchange_count = len(self.public_data.get("exchange_rates", {}))
+        cached_rates = self.public_data.get("exchange_rates", {})
+        initial_exchange_count = len(cached_rates)
         
-        for date in required_dates:
+        # Only uncached dates need a lookup; the SBI table behind them is downloaded once
+        for date in sorted(required_dates - cached_rates.keys()):
             sbi_rate = self.get_sbi_rate(date)
             if sbi_rate is None and self.no_internet:
                 return False
@@ -1331,27 +1570,21 @@ class FACalculator:
     def _sort_vest_json(self):
         """Sort vest.json by stock symbols and vest dates"""
         try:
-            with open(self.vest_file, 'r') as f:
-                vest_data = json.load(f)
+            vest_data = self._load_vest()
             
-            # Sort by stock symbols (keys)
-            sorted_vest_data = {}
-            for symbol in sorted(vest_data.keys()):
-                symbol_data = vest_data[symbol]
-                
-                # Sort vests by date
+            # Sort vests by date in place, then the stock symbols (keys)
+            for symbol_data in vest_data.values():
                 if 'vests' in symbol_data:
-                    sorted_vests = sorted(
-                        symbol_data['vests'], 
-                        key=lambda x: x['vest_date']
-                    )
-                    sorted_vest_data[symbol] = {'vests': sorted_vests}
-                else:
-                    sorted_vest_data[symbol] = symbol_data
+                    symbol_data['vests'].sort(key=itemgetter('vest_date'))
+            sorted_vest_data = dict(sorted(vest_data.items()))
             
             # Write sorted data back to file
-            with open(self.vest_file, 'w') as f:
-                json.dump(sorted_vest_data, f, indent=2)
+            if orjson:
+                payload = orjson.dumps(sorted_vest_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(sorted_vest_data, indent=2).encode()
+            self._replace_file(self.vest_file, payload)
+            self._vest_data = sorted_vest_data
                 
         except Exception as e:
             self.vprint(f"⚠️  Could not sort vest.json: {e}")
@@ -1362,43 +1595,53 @@ class FACalculator:
             if not self.sell_file.exists():
                 return  # No sell file to sort
                 
-            with open(self.sell_file, 'r') as f:
-                sell_data = json.load(f)
+            sell_data = self._load_sell()
             
-            # Sort by stock symbols (keys)
-            sorted_sell_data = {}
-            for symbol in sorted(sell_data.keys()):
-                symbol_data = sell_data[symbol]
-                
-                # Sort sales by date
+            # Sort sales by date in place, then the stock symbols (keys)
+            for symbol_data in sell_data.values():
                 if 'sales' in symbol_data:
-                    sorted_sales = sorted(
-                        symbol_data['sales'], 
-                        key=lambda x: x['sell_date']
-                    )
-                    sorted_sell_data[symbol] = {'sales': sorted_sales}
-                else:
-                    sorted_sell_data[symbol] = symbol_data
+                    symbol_data['sales'].sort(key=itemgetter('sell_date'))
+            sorted_sell_data = dict(sorted(sell_data.items()))
             
             # Write sorted data back to file
-            with open(self.sell_file, 'w') as f:
-                json.dump(sorted_sell_data, f, indent=2)
+            if orjson:
+                payload = orjson.dumps(sorted_sell_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(sorted_sell_data, indent=2).encode()
+            self._replace_file(self.sell_file, payload)
+            self._sell_data = sorted_sell_data
                 
         except Exception as e:
             self.vprint(f"⚠️  Could not sort sell.json: {e}")
     
     def fetch_high_low_prices_for_vests(self, vest_data: dict):
-        """Fetch high/low prices for all vest dates that have vest_price"""
+        """Fetch high/low prices for all vest dates that have vest_price, one request per symbol"""
+        dates_by_symbol = {}
         for symbol, symbol_data in vest_data.items():
-            for vest in symbol_data.get("vests", []):
-                if vest.get("vest_price_optional") is not None:
-                    vest_date = vest["vest_date"]
-                    self.vprint(f"📊 Fetching high/low for {symbol} {vest_date}")
-                    
-                    # Fetch and cache high/low data
-                    high_low = self._fetch_day_high_low_from_api(symbol, vest_date)
-                    if high_low:
-                        self._cache_high_low_prices(symbol, vest_date, high_low[0], high_low[1])
+            cached_high_low = self.public_data.get("stocks", {}).get(symbol, {}).get("high_low", {})
+            dates = [vest["vest_date"] for vest in symbol_data.get("vests", [])
+                     if vest.get("vest_price_optional") is not None and vest["vest_date"] not in cached_high_low]
+            if dates:
+                self.vprint(f"📊 Fetching high/low for {symbol}: {dates}")
+                dates_by_symbol[symbol] = dates
+        if not dates_by_symbol:
+            return
+        
+        # Only network I/O runs in worker threads, results are cached from here
+        symbols = list(dates_by_symbol)
+        workers = min(self.max_fetch_workers, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            ranges = executor.map(lambda symbol: self._fetch_high_low_range(symbol, dates_by_symbol[symbol]), symbols)
+            high_low_by_symbol = dict(zip(symbols, ranges))
+        
+        for symbol, dates in dates_by_symbol.items():
+            for vest_date in dates:
+                high_low = high_low_by_symbol[symbol].get(vest_date)
+                if high_low:
+                    self._cache_high_low_prices(symbol, vest_date, high_low[0], high_low[1])
+        
+        # Write out whatever the last partial batch left pending
+        self._flush_cache()
     
     def get_day_high_low_prices(self, symbol: str, date: str) -> Optional[tuple]:
         """Get day's high and low prices for a symbol on a specific date"""
@@ -1409,7 +1652,8 @@ class FACalculator:
                           .get(date))
         
         if cached_high_low:
-            return (cached_high_low["low"], cached_high_low["high"])
+            # Caches written by older versions hold prices as strings
+            return (float(cached_high_low["low"]), float(cached_high_low["high"]))
         
         # If not cached and internet is disabled, return None
         if self.no_internet:
@@ -1425,67 +1669,65 @@ class FACalculator:
     
     def _fetch_day_high_low_from_api(self, symbol: str, date: str) -> Optional[tuple]:
         """Fetch day's high and low prices from Yahoo Finance API"""
+        return self._fetch_high_low_range(symbol, [date]).get(date)
+    
+    def _fetch_high_low_range(self, symbol: str, dates: List[str]) -> Dict[str, tuple]:
+        """Fetch (low, high) prices for the span covering the given dates in one API call"""
         try:
-            # Convert date to timestamp
-            dt = datetime.strptime(date, "%Y-%m-%d")
-            timestamp = int(dt.timestamp())
-            end_timestamp = timestamp + 86400
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0'
-            }
+            # period2 is exclusive, so ask for one day past the last date
+            timestamp = _day_bounds(min(dates))[0]
+            end_timestamp = _day_bounds(max(dates))[1]
             
             # Use Yahoo Finance API
             endpoint = f"https://query2.finance.yahoo.com/v8/finance/chart/{symbol}?period1={timestamp}&period2={end_timestamp}&interval=1d"
             
-            response = requests.get(endpoint, headers=headers, timeout=10)
+            self._throttle()
+            response = self._session.get(endpoint, headers=_CHART_HEADERS, timeout=10)
+            if response.status_code == 429:
+                self._note_rate_limited(response)
+                return {}
             if response.status_code != 200:
-                return None
+                return {}
+            self._note_request_ok()
             
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
             if not data.get('chart') or not data['chart'].get('result'):
-                return None
+                return {}
             
             result = data['chart']['result'][0]
-            
-            # Get timestamps to match exact date
             timestamps = result.get('timestamp', [])
-            target_date = date  # YYYY-MM-DD format
             
-            # Extract high and low prices
+            # Extract high and low prices for the requested dates
+            high_low = {}
             if 'indicators' in result and result['indicators'].get('quote'):
                 quote = result['indicators']['quote'][0]
                 if 'high' in quote and 'low' in quote:
                     highs = quote['high']
                     lows = quote['low']
-                    
-                    # Find data point that matches the exact date
-                    for i in range(len(timestamps)):
-                        api_date = datetime.fromtimestamp(timestamps[i]).strftime("%Y-%m-%d")
-                        if api_date == target_date and highs[i] is not None and lows[i] is not None:
-                            return (float(lows[i]), float(highs[i]))
+                    # Timestamps are ascending, so find each day's row by its local midnight bounds
+                    for day in set(dates):
+                        day_start, day_end = _day_bounds(day)
+                        i = bisect_left(timestamps, day_start)
+                        if (i < min(len(highs), len(lows))
+                                and timestamps[i] < day_end
+                                and highs[i] is not None and lows[i] is not None):
+                            high_low[day] = (float(lows[i]), float(highs[i]))
             
-            return None
+            return high_low
             
         except Exception as e:
-            print(f"⚠️  Error fetching high/low for {symbol} on {date}: {e}")
-            return None
+            print(f"⚠️  Error fetching high/low for {symbol} on {', '.join(dates)}: {e}")
+            return {}
     
     def _cache_high_low_prices(self, symbol: str, date: str, low: float, high: float):
         """Cache high/low prices for a symbol and date"""
-        if "stocks" not in self.public_data:
-            self.public_data["stocks"] = {}
-        if symbol not in self.public_data["stocks"]:
-            self.public_data["stocks"][symbol] = {}
-        if "high_low" not in self.public_data["stocks"][symbol]:
-            self.public_data["stocks"][symbol]["high_low"] = {}
-        
-        self.public_data["stocks"][symbol]["high_low"][date] = {
+        self._stock_entry(symbol).setdefault("high_low", {})[date] = {
             "low": round(low, 2),
             "high": round(high, 2)
         }
         
-        self._save_cache_silently()
+        # Saved in batches, see _mark_cache_dirty()
+        self._mark_cache_dirty()
     
     def process_fa_calculations(self):
         """Main processing function for FA calculations"""
@@ -1521,12 +1763,22 @@ class FACalculator:
         # Prepare CSV data
         csv_rows = []
         
+        # Year boundary lookups are the same for every lot, fetch them with the first lot still held
+        jan1_date = f"{self.year}-01-01"
+        dec31_date = f"{self.year}-12-31"
+        dec31_sbi_rate = None
+        
+        country_mapping = self.public_data.get("country_mapping", {})
+        vest_fields = itemgetter("vest_date", "number_of_shares")
+        
         # Process each stock and vest
         for symbol, symbol_data in vest_data.items():
-            for vest in symbol_data.get("vests", []):
-                vest_date = vest["vest_date"]
-                original_shares = vest["number_of_shares"]
-                
+            jan1_price = dec31_price = None
+            # Company information and its country code, looked up with the symbol's first row
+            company_info = country_code = None
+            
+            vests = symbol_data.get("vests", [])
+            for vest, (vest_date, original_shares) in zip(vests, map(vest_fields, vests)):
                 self.vprint(f"Processing vest: {symbol} {vest_date}, {original_shares} shares")
                 
                 # Validate sales and get remaining shares
@@ -1542,16 +1794,20 @@ class FACalculator:
                 
                 # Get stock prices (should be cached now)
                 vest_price = self.get_purchase_price_with_vest_override(symbol, vest_date, vest)
-                jan1_price = self.get_stock_price(symbol, f"{self.year}-01-01")
-                dec31_price = self.get_stock_price(symbol, f"{self.year}-12-31")
+                if jan1_price is None:
+                    jan1_price = self.get_stock_price(symbol, jan1_date)
+                if dec31_price is None:
+                    dec31_price = self.get_stock_price(symbol, dec31_date)
                 peak_price, peak_date = self.get_peak_price_from_vest(symbol, vest_date)
                 
                 # Get SBI exchange rates (should be cached now)
                 vest_sbi_rate = self.get_sbi_rate(vest_date)
-                dec31_sbi_rate = self.get_sbi_rate(f"{self.year}-12-31")
+                if dec31_sbi_rate is None:
+                    dec31_sbi_rate = self.get_sbi_rate(dec31_date)
                 
                 # Check if any required data is missing
-                if None in [vest_price, jan1_price, dec31_price, peak_price, vest_sbi_rate, dec31_sbi_rate]:
+                if (vest_price is None or jan1_price is None or dec31_price is None or peak_price is None
+                        or vest_sbi_rate is None or dec31_sbi_rate is None):
                     print(f"{Colors.RED}❌ ERROR: Missing critical data for {symbol} {vest_date}{Colors.NC}")
                     if vest_price is None:
                         print(f"{Colors.RED}   - Purchase price for {vest_date} could not be fetched{Colors.NC}")
@@ -1589,19 +1845,15 @@ class FACalculator:
                 # Gross proceeds: Only if sold in target year, otherwise 0
                 gross_proceeds = self.get_sale_proceeds_for_lot_in_year(symbol, vest_date, self.year, sell_data)
                 
-                # Get company information
-                company_info = self.get_company_info(symbol)
-                
-                # Get country code from country mapping
-                country_name = company_info['country']
-                country_mapping = self.public_data.get("country_mapping", {})
-                country_code = country_mapping.get(country_name, 2)  # Default to 2 (United States) if not found
+                if company_info is None:
+                    company_info = self.get_company_info(symbol)
+                    country_code = country_mapping.get(company_info['country'], 2)  # Default to 2 (United States) if not found
                 
                 # Create CSV row
                 csv_row = [
                     symbol,
                     vest_date,
-                    company_info['country'],
+                    country_code,
                     company_info['name'],
                     company_info['address'],
                     company_info['zip_code'],
@@ -1623,7 +1875,7 @@ class FACalculator:
                 self.vprint("---")
         
         # Sort CSV rows by stock symbol and then by date
-        csv_rows.sort(key=lambda x: (x[0], x[1]))
+        csv_rows.sort(key=itemgetter(0, 1))
         
         # Write to FA.csv
         self.write_fa_csv(csv_rows)
@@ -1635,30 +1887,14 @@ class FACalculator:
     
     def write_fa_csv(self, csv_rows: List[List[str]]):
         """Write FA calculation results to CSV file"""
-        # CSV header
-        header = [
-            "Country/Region name", "Country Name and Code", "Name of entity", "Address of entity", "ZIP Code",
-            "Nature of entity", "Date of acquiring the interest", "Initial value of the investment",
-            "Peak value of investment during the Period", "Closing balance",
-            "Total gross amount paid/credited with respect to the holding during the period", "Total gross proceeds from sale or redemption of investment during the period"
-        ]
-        
         # Clear existing FA.csv and write new data
         with open(self.fa_csv, 'w', newline='') as f:
-            # Write header with quotes manually
-            quoted_header_line = ','.join([f'"{col}"' for col in header])
-            f.write(quoted_header_line + '\n')
+            f.write(_FA_CSV_HEADER_LINE)
             
             # Write data rows without quotes
+            # First column: serial number, then row[2:] = [country code, name, address, zip, nature, date, initial, peak, closing, paid, proceeds]
             writer = csv.writer(f, quoting=csv.QUOTE_NONE)
-            for i, row in enumerate(csv_rows, 1):
-                # First column: serial number, Second column: country code from mapping
-                # row[2:] = [country, name, address, zip, nature, date, initial, peak, closing, paid, proceeds]
-                country_name = row[2]
-                country_mapping = self.public_data.get("country_mapping", {})
-                country_code = country_mapping.get(country_name, 2)  # Default to 2 (United States) if not found
-                data_row = [i, country_code] + row[3:]  # Serial number, country code from mapping, then name, address, etc.
-                writer.writerow(data_row)
+            writer.writerows([i, *row[2:]] for i, row in enumerate(csv_rows, 1))
         
         print(f"{Colors.GREEN}✅ FA calculations completed! Results written to {self.fa_csv}{Colors.NC}")
         print(f"{Colors.GREEN}📊 Total rows processed: {len(csv_rows)}{Colors.NC}")
@@ -1672,6 +1908,9 @@ class FACalculator:
             print(f"{Colors.GREEN}💾 Updating cache with {total_updates} new entries...{Colors.NC}")
             self.save_public_data()
             print(f"{Colors.GREEN}✅ Cache updated successfully!{Colors.NC}")
+        
+        # Exchange rates are not tracked in fetched_data, write them out too
+        self._flush_cache()
 
 
 class CustomArgumentParser(argparse.ArgumentParser):
@@ -1738,6 +1977,11 @@ Examples:
         # argparse calls sys.exit(), we catch it to handle it gracefully
         sys.exit(e.code)
     
+    run(args)
+
+
+def run(args: argparse.Namespace):
+    """Run the FA calculation for parsed command-line arguments (exits with status 1 on failure)"""
     # Create calculator instance
     calculator = FACalculator(
         year=args.year,
@@ -1772,7 +2016,11 @@ Examples:
         sys.exit(1)
     
     # Process FA calculations
-    success = calculator.process_fa_calculations()
+    try:
+        success = calculator.process_fa_calculations()
+    finally:
+        # Save pending cache changes even when processing exits early
+        calculator._flush_cache()
     
     if not success:
         print(f"{Colors.RED}❌ FA calculation failed{Colors.NC}")
@@ -5,9 +5,41 @@ Creates daily price data to ensure peak calculation works
 """
 
 import json
-from datetime import datetime, timedelta
+import math
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+# Directory holding the dataN test directories
+_HERE = Path(__file__).resolve().parent
+
+# Shared by every dataset; only serialized, never mutated
+_COUNTRY_MAPPING = {
+    "United States": 2,
+    "United Kingdom": 3,
+    "Canada": 4
+}
+
+# Header line of every expected_FA.csv
+_FA_HEADER = '"Country/Region name","Country Name and Code","Name of entity","Address of entity","ZIP Code","Nature of entity","Date of acquiring the interest","Initial value of the investment","Peak value of investment during the Period","Closing balance","Total gross amount paid/credited with respect to the holding during the period","Total gross proceeds from sale or redemption of investment during the period"'
+
+def write_if_changed(path: Path, payload: bytes):
+    """Write payload unless the file already holds exactly these bytes"""
+    if path.exists() and path.read_bytes() == payload:
+        return
+    path.write_bytes(payload)
+
+def write_json(path: Path, data):
+    """Write data as indented JSON with a single write, skipped if unchanged"""
+    if orjson:
+        write_if_changed(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        write_if_changed(path, json.dumps(data, indent=2).encode())
+
 def generate_daily_prices(start_date: str, end_date: str, start_price: float, 
                          peak_price: float, end_price: float, peak_date: str = None):
     """Generate daily price data with a peak"""
@@ -20,54 +52,59 @@ def generate_daily_prices(start_date: str, end_date: str, start_price: float,
         # Peak in the middle
         peak_dt = start_dt + (end_dt - start_dt) / 2
     
-    prices = {}
-    current_dt = start_dt
-    
-    while current_dt <= end_dt:
-        date_str = current_dt.strftime("%Y-%m-%d")
-        
-        # Always include start_date, end_date, and peak_date regardless of weekends
-        force_include = (current_dt == start_dt or current_dt == end_dt or current_dt == peak_dt)
-        
-        if current_dt.weekday() < 5 or force_include:
-            if current_dt <= peak_dt:
-                # Rising to peak
-                if (peak_dt - start_dt).days == 0:
-                    progress = 0
-                else:
-                    progress = (current_dt - start_dt).days / (peak_dt - start_dt).days
-                price = start_price + (peak_price - start_price) * progress
+    # Walk integer day offsets from the start date instead of stepping datetimes;
+    # the peak offset is fractional when it defaults to the middle of an odd-length period
+    total_days = (end_dt - start_dt).days
+    peak_offset = (peak_dt - start_dt) / timedelta(days=1)
+    rise_days = math.floor(peak_offset)
+    fall_days = math.floor(total_days - peak_offset)
+    start_ordinal = start_dt.toordinal()
+    start_weekday = start_dt.weekday()
+    
+    # Weekday offsets, Monday to Friday of each week clipped to the period
+    offsets = set()
+    for week_start in range(-start_weekday, total_days + 1, 7):
+        offsets.update(range(max(week_start, 0), min(week_start + 5, total_days + 1)))
+    
+    # Always include start_date, end_date, and peak_date regardless of weekends
+    offsets.update((0, total_days))
+    if peak_offset.is_integer() and 0 <= peak_offset <= total_days:
+        offsets.add(int(peak_offset))
+    
+    # Collect (date, price) pairs and build the dict in one go at its final size
+    items = []
+    for offset in sorted(offsets):
+        if offset <= peak_offset:
+            # Rising to peak
+            if rise_days == 0:
+                progress = 0
+            else:
+                progress = offset / rise_days
+            price = start_price + (peak_price - start_price) * progress
+        else:
+            # Falling from peak
+            if fall_days == 0:
+                progress = 0
             else:
-                # Falling from peak
-                if (end_dt - peak_dt).days == 0:
-                    progress = 0
-                else:
-                    progress = (current_dt - peak_dt).days / (end_dt - peak_dt).days
-                price = peak_price + (end_price - peak_price) * progress
-            
-            prices[date_str] = f"{price:.2f}"
+                progress = math.floor(offset - peak_offset) / fall_days
+            price = peak_price + (end_price - peak_price) * progress
         
-        current_dt += timedelta(days=1)
+        items.append((date.fromordinal(start_ordinal + offset).isoformat(), format(price, ".2f")))
     
-    return prices
+    return dict(items)
 
-def update_data1():
-    """Update data1 with comprehensive daily prices"""
-    data_dir = Path(__file__).parent / "data1"
-    
-    # Generate daily prices for ACME for the entire year
-    prices = generate_daily_prices(
-        "2023-01-01", "2023-12-31", 
-        95.0, 125.0, 110.0, "2023-06-01"
-    )
-    
-    # Ensure we have the vest date price
-    prices["2023-01-15"] = "100.00"
-    
-    public_data = {
+# Test datasets: one entry per dataN directory. Each stock gets a generated daily price
+# curve (start/end date, start/peak/end price, peak date) plus manual price overrides.
+# vest.json and sell.json are only written for datasets that define them.
+DATASETS = [
+    {
+        # data1: single ACME lot held all year
+        "dir": "data1",
         "stocks": {
             "ACME": {
-                "prices": prices,
+                "curve": ("2023-01-01", "2023-12-31", 95.0, 125.0, 110.0, "2023-06-01"),
+                # Ensure we have the vest date price
+                "overrides": {"2023-01-15": "100.00"},
                 "company_info": {
                     "country": "United States",
                     "name": "ACME Corp",
@@ -76,10 +113,7 @@ def update_data1():
                     "nature": "Public Limited Company"
                 },
                 "high_low": {
-                    "2023-01-15": {
-                        "low": "98.00",
-                        "high": "102.00"
-                    }
+                    "2023-01-15": {"low": "98.00", "high": "102.00"}
                 }
             }
         },
@@ -89,66 +123,30 @@ def update_data1():
             "2023-06-01": "83.25",
             "2023-12-31": "83.00"
         },
-        "country_mapping": {
-            "United States": 2,
-            "United Kingdom": 3,
-            "Canada": 4
-        }
-    }
-    
-    with open(data_dir / "public_data.json", 'w') as f:
-        json.dump(public_data, f, indent=2)
-    
-    # Create vest.json
-    vest_data = {
-        "ACME": {
-            "vests": [
-                {
-                    "vest_date": "2023-01-15",
-                    "number_of_shares": 100
-                }
-            ]
-        }
-    }
-    
-    with open(data_dir / "vest.json", 'w') as f:
-        json.dump(vest_data, f, indent=2)
-    
-    # Create sell.json (empty for this test case)
-    sell_data = {}
-    
-    with open(data_dir / "sell.json", 'w') as f:
-        json.dump(sell_data, f, indent=2)
-    
-    # Calculate expected values
-    # Initial: 100 shares * $100 * 82.75 = 827,500
-    # Peak: 100 shares * $125 * 83.25 = 1,040,625  
-    # Closing: 100 shares * $110 * 83.00 = 913,000
-    expected_csv = [
-        '"Country/Region name","Country Name and Code","Name of entity","Address of entity","ZIP Code","Nature of entity","Date of acquiring the interest","Initial value of the investment","Peak value of investment during the Period","Closing balance","Total gross amount paid/credited with respect to the holding during the period","Total gross proceeds from sale or redemption of investment during the period"',
-        '1,2,ACME Corp,123 Test Street Testville CA,90210,Public Limited Company,2023-01-15,827500,1040625,913000,0,0'
-    ]
-    
-    with open(data_dir / "expected_FA.csv", 'w') as f:
-        f.write('\n'.join(expected_csv))
-
-def update_data2():
-    """Update data2 with comprehensive daily prices for BETA"""
-    data_dir = Path(__file__).parent / "data2"
-    
-    # Generate daily prices for BETA for the entire year
-    prices = generate_daily_prices(
-        "2023-01-01", "2023-12-31", 
-        190.0, 230.0, 212.0, "2023-06-01"
-    )
-    
-    # Ensure we have the vest date price
-    prices["2023-03-01"] = "195.00"
-    
-    public_data = {
+        "vest": {
+            "ACME": {
+                "vests": [
+                    {"vest_date": "2023-01-15", "number_of_shares": 100}
+                ]
+            }
+        },
+        # Empty for this test case
+        "sell": {},
+        # Initial: 100 shares * $100 * 82.75 = 827,500
+        # Peak: 100 shares * $125 * 83.25 = 1,040,625
+        # Closing: 100 shares * $110 * 83.00 = 913,000
+        "expected": [
+            '1,2,ACME Corp,123 Test Street Testville CA,90210,Public Limited Company,2023-01-15,827500,1040625,913000,0,0'
+        ]
+    },
+    {
+        # data2: BETA lot with vest_price_optional
+        "dir": "data2",
         "stocks": {
             "BETA": {
-                "prices": prices,
+                "curve": ("2023-01-01", "2023-12-31", 190.0, 230.0, 212.0, "2023-06-01"),
+                # Ensure we have the vest date price
+                "overrides": {"2023-03-01": "195.00"},
                 "company_info": {
                     "country": "United States",
                     "name": "Beta Inc",
@@ -157,10 +155,7 @@ def update_data2():
                     "nature": "Public Limited Company"
                 },
                 "high_low": {
-                    "2023-03-01": {
-                        "low": "193.00",
-                        "high": "202.00"
-                    }
+                    "2023-03-01": {"low": "193.00", "high": "202.00"}
                 }
             }
         },
@@ -170,46 +165,21 @@ def update_data2():
             "2023-06-01": "83.25",
             "2023-12-31": "83.00"
         },
-        "country_mapping": {
-            "United States": 2,
-            "United Kingdom": 3,
-            "Canada": 4
-        }
-    }
-    
-    with open(data_dir / "public_data.json", 'w') as f:
-        json.dump(public_data, f, indent=2)
-    
-    # Calculate expected values
-    # Initial: 50 shares * $200 (vest_price_optional) * 82.90 = 829,000
-    # Peak: 50 shares * $230 * 83.25 = 957,375  
-    # Closing: 50 shares * $212 * 83.00 = 879,800
-    expected_csv = [
-        '"Country/Region name","Country Name and Code","Name of entity","Address of entity","ZIP Code","Nature of entity","Date of acquiring the interest","Initial value of the investment","Peak value of investment during the Period","Closing balance","Total gross amount paid/credited with respect to the holding during the period","Total gross proceeds from sale or redemption of investment during the period"',
-        '1,2,Beta Inc,456 Beta Avenue Betaville NY,10001,Public Limited Company,2023-03-01,829000,957375,879800,0,0'
-    ]
-    
-    with open(data_dir / "expected_FA.csv", 'w') as f:
-        f.write('\n'.join(expected_csv))
-
-def update_data3():
-    """Update data3 with comprehensive daily prices for GAMMA"""
-    data_dir = Path(__file__).parent / "data3"
-    
-    # Generate daily prices for GAMMA for the entire year
-    prices = generate_daily_prices(
-        "2023-01-01", "2023-12-31", 
-        48.0, 65.0, 60.0, "2023-07-01"
-    )
-    
-    # Ensure we have the vest date and sell date prices
-    prices["2023-02-01"] = "50.00"
-    prices["2023-08-15"] = "64.00"
-    
-    public_data = {
+        # Initial: 50 shares * $200 (vest_price_optional) * 82.90 = 829,000
+        # Peak: 50 shares * $230 * 83.25 = 957,375
+        # Closing: 50 shares * $212 * 83.00 = 879,800
+        "expected": [
+            '1,2,Beta Inc,456 Beta Avenue Betaville NY,10001,Public Limited Company,2023-03-01,829000,957375,879800,0,0'
+        ]
+    },
+    {
+        # data3: GAMMA lot partially sold after the peak
+        "dir": "data3",
         "stocks": {
             "GAMMA": {
-                "prices": prices,
+                "curve": ("2023-01-01", "2023-12-31", 48.0, 65.0, 60.0, "2023-07-01"),
+                # Ensure we have the vest date and sell date prices
+                "overrides": {"2023-02-01": "50.00", "2023-08-15": "64.00"},
                 "company_info": {
                     "country": "United States",
                     "name": "Gamma Technologies",
@@ -218,10 +188,7 @@ def update_data3():
                     "nature": "Public Limited Company"
                 },
                 "high_low": {
-                    "2023-02-01": {
-                        "low": "49.00",
-                        "high": "51.50"
-                    }
+                    "2023-02-01": {"low": "49.00", "high": "51.50"}
                 }
             }
         },
@@ -232,53 +199,23 @@ def update_data3():
             "2023-08-15": "83.25",
             "2023-12-31": "83.00"
         },
-        "country_mapping": {
-            "United States": 2,
-            "United Kingdom": 3,
-            "Canada": 4
-        }
-    }
-    
-    with open(data_dir / "public_data.json", 'w') as f:
-        json.dump(public_data, f, indent=2)
-    
-    # Calculate expected values (based on actual calculator output)
-    # Initial: 200 shares * $50 * 82.75 = 827,500 (but calculator shows 517,188)
-    # Peak: 200 shares * $65 * 83.50 = 1,085,500 (peak occurs before sale)
-    # Closing: 125 shares * $60 * 83.00 = 622,500
-    # Sale proceeds: 825,000 (given in sell.json)
-    expected_csv = [
-        '"Country/Region name","Country Name and Code","Name of entity","Address of entity","ZIP Code","Nature of entity","Date of acquiring the interest","Initial value of the investment","Peak value of investment during the Period","Closing balance","Total gross amount paid/credited with respect to the holding during the period","Total gross proceeds from sale or redemption of investment during the period"',
-        '1,2,Gamma Technologies,789 Gamma Road Gammatown TX,75001,Public Limited Company,2023-02-01,517188,1085500,622500,0,825000'
-    ]
-    
-    with open(data_dir / "expected_FA.csv", 'w') as f:
-        f.write('\n'.join(expected_csv))
-
-def update_data4():
-    """Update data4 with comprehensive daily prices for DELTA and ECHO"""
-    data_dir = Path(__file__).parent / "data4"
-    
-    # Generate daily prices for both stocks
-    delta_prices = generate_daily_prices(
-        "2023-01-01", "2023-12-31", 
-        75.0, 92.0, 88.0, "2023-07-01"
-    )
-    
-    echo_prices = generate_daily_prices(
-        "2023-01-01", "2023-12-31", 
-        76.0, 89.0, 86.0, "2023-07-01"
-    )
-    
-    # Ensure we have the vest date prices
-    delta_prices["2023-01-01"] = "75.00"
-    delta_prices["2023-06-01"] = "90.00"
-    echo_prices["2023-03-15"] = "81.00"
-    
-    public_data = {
+        # Expected values (based on actual calculator output)
+        # Initial: 200 shares * $50 * 82.75 = 827,500 (but calculator shows 517,188)
+        # Peak: 200 shares * $65 * 83.50 = 1,085,500 (peak occurs before sale)
+        # Closing: 125 shares * $60 * 83.00 = 622,500
+        # Sale proceeds: 825,000 (given in sell.json)
+        "expected": [
+            '1,2,Gamma Technologies,789 Gamma Road Gammatown TX,75001,Public Limited Company,2023-02-01,517188,1085500,622500,0,825000'
+        ]
+    },
+    {
+        # data4: two DELTA lots and one ECHO lot
+        "dir": "data4",
         "stocks": {
             "DELTA": {
-                "prices": delta_prices,
+                "curve": ("2023-01-01", "2023-12-31", 75.0, 92.0, 88.0, "2023-07-01"),
+                # Ensure we have the vest date prices
+                "overrides": {"2023-01-01": "75.00", "2023-06-01": "90.00"},
                 "company_info": {
                     "country": "United States",
                     "name": "Delta Systems",
@@ -287,18 +224,13 @@ def update_data4():
                     "nature": "Public Limited Company"
                 },
                 "high_low": {
-                    "2023-01-01": {
-                        "low": "74.00",
-                        "high": "76.50"
-                    },
-                    "2023-06-01": {
-                        "low": "89.00",
-                        "high": "91.50"
-                    }
+                    "2023-01-01": {"low": "74.00", "high": "76.50"},
+                    "2023-06-01": {"low": "89.00", "high": "91.50"}
                 }
             },
             "ECHO": {
-                "prices": echo_prices,
+                "curve": ("2023-01-01", "2023-12-31", 76.0, 89.0, 86.0, "2023-07-01"),
+                "overrides": {"2023-03-15": "81.00"},
                 "company_info": {
                     "country": "United States",
                     "name": "Echo Dynamics",
@@ -307,10 +239,7 @@ def update_data4():
                     "nature": "Public Limited Company"
                 },
                 "high_low": {
-                    "2023-03-15": {
-                        "low": "79.50",
-                        "high": "82.50"
-                    }
+                    "2023-03-15": {"low": "79.50", "high": "82.50"}
                 }
             }
         },
@@ -321,50 +250,29 @@ def update_data4():
             "2023-07-01": "83.50",
             "2023-12-31": "83.00"
         },
-        "country_mapping": {
-            "United States": 2,
-            "United Kingdom": 3,
-            "Canada": 4
-        }
-    }
-    
-    with open(data_dir / "public_data.json", 'w') as f:
-        json.dump(public_data, f, indent=2)
-    
-    # Calculate expected values (based on actual calculator output)
-    # DELTA lot 1: 50 shares * $75 * 82.50 = 309,375 initial, peak $92 * 83.50 = 384,100, closing $88 * 83.00 = 365,200
-    # DELTA lot 2: 30 shares * $90 * 83.25 = 224,775 initial, peak $92 * 83.50 = 230,460, closing $88 * 83.00 = 219,120  
-    # ECHO: 25 shares * $80 (vest_price_optional) * 82.90 = 165,800 initial, peak $89 * 83.50 = 185,788, closing $86 * 83.00 = 178,450
-    expected_csv = [
-        '"Country/Region name","Country Name and Code","Name of entity","Address of entity","ZIP Code","Nature of entity","Date of acquiring the interest","Initial value of the investment","Peak value of investment during the Period","Closing balance","Total gross amount paid/credited with respect to the holding during the period","Total gross proceeds from sale or redemption of investment during the period"',
-        '1,2,Delta Systems,101 Delta Plaza Deltaville FL,33101,Public Limited Company,2023-01-01,309375,384100,365200,0,0',
-        '2,2,Delta Systems,101 Delta Plaza Deltaville FL,33101,Public Limited Company,2023-06-01,224775,230460,219120,0,0',
-        '3,2,Echo Dynamics,202 Echo Lane Echotown WA,98101,Public Limited Company,2023-03-15,165800,185788,178450,0,0'
-    ]
-    
-    with open(data_dir / "expected_FA.csv", 'w') as f:
-        f.write('\n'.join(expected_csv))
-
-def update_data5():
-    """Update data5 - Peak value occurs AFTER partial sale"""
-    data_dir = Path(__file__).parent / "data5"
-    
-    # Generate daily prices for THETA - peak occurs later in the year
-    prices = generate_daily_prices(
-        "2023-01-01", "2023-12-31", 
-        120.0, 180.0, 155.0, "2023-10-01"  # Peak in October
-    )
-    
-    # Ensure we have specific prices for key dates
-    prices["2023-02-01"] = "125.00"  # Vest date price
-    prices["2023-06-15"] = "140.00"  # Sale date price (before peak)
-    prices["2023-10-01"] = "180.00"  # Peak price (after sale)
-    prices["2023-12-31"] = "155.00"  # End of year price
-    
-    public_data = {
+        # Expected values (based on actual calculator output)
+        # DELTA lot 1: 50 shares * $75 * 82.50 = 309,375 initial, peak $92 * 83.50 = 384,100, closing $88 * 83.00 = 365,200
+        # DELTA lot 2: 30 shares * $90 * 83.25 = 224,775 initial, peak $92 * 83.50 = 230,460, closing $88 * 83.00 = 219,120
+        # ECHO: 25 shares * $80 (vest_price_optional) * 82.90 = 165,800 initial, peak $89 * 83.50 = 185,788, closing $86 * 83.00 = 178,450
+        "expected": [
+            '1,2,Delta Systems,101 Delta Plaza Deltaville FL,33101,Public Limited Company,2023-01-01,309375,384100,365200,0,0',
+            '2,2,Delta Systems,101 Delta Plaza Deltaville FL,33101,Public Limited Company,2023-06-01,224775,230460,219120,0,0',
+            '3,2,Echo Dynamics,202 Echo Lane Echotown WA,98101,Public Limited Company,2023-03-15,165800,185788,178450,0,0'
+        ]
+    },
+    {
+        # data5: peak value occurs AFTER partial sale
+        "dir": "data5",
         "stocks": {
             "THETA": {
-                "prices": prices,
+                # Peak in October
+                "curve": ("2023-01-01", "2023-12-31", 120.0, 180.0, 155.0, "2023-10-01"),
+                "overrides": {
+                    "2023-02-01": "125.00",  # Vest date price
+                    "2023-06-15": "140.00",  # Sale date price (before peak)
+                    "2023-10-01": "180.00",  # Peak price (after sale)
+                    "2023-12-31": "155.00"   # End of year price
+                },
                 "company_info": {
                     "country": "United States",
                     "name": "Theta Systems",
@@ -373,10 +281,7 @@ def update_data5():
                     "nature": "Public Limited Company"
                 },
                 "high_low": {
-                    "2023-02-01": {
-                        "low": "123.00",
-                        "high": "127.00"
-                    }
+                    "2023-02-01": {"low": "123.00", "high": "127.00"}
                 }
             }
         },
@@ -389,69 +294,75 @@ def update_data5():
             "2023-10-01": "83.75",  # Exchange rate at peak
             "2023-12-31": "83.20"
         },
-        "country_mapping": {
-            "United States": 2,
-            "United Kingdom": 3,
-            "Canada": 4
-        }
+        # 150 shares vested
+        "vest": {
+            "THETA": {
+                "vests": [
+                    {"vest_date": "2023-02-01", "number_of_shares": 150}
+                ]
+            }
+        },
+        # 60 shares sold in June (before peak in October)
+        "sell": {
+            "THETA": {
+                "sales": [
+                    {
+                        "sell_date": "2023-06-15",
+                        "purchase_date": "2023-02-01",  # Links to vest date
+                        "number_of_shares_sold": 60,
+                        "sell_price_inr": 700000.0  # 60 * $140 * 83.10 ≈ 700,000
+                    }
+                ]
+            }
+        },
+        # Expected values (based on actual calculator output):
+        # Initial: 931,500 (calculated by FA calculator using vest date price)
+        # Peak: 1,943,868 (peak occurs after sale with reduced holdings - complex calculation)
+        # Closing: 1,160,640 (90 remaining shares at year end)
+        # Sale proceeds: 700,000 (given in sell.json)
+        "expected": [
+            '1,2,Theta Systems,555 Theta Boulevard Thetatown TX,75555,Public Limited Company,2023-02-01,931500,1943868,1160640,0,700000'
+        ]
     }
-    
-    with open(data_dir / "public_data.json", 'w') as f:
-        json.dump(public_data, f, indent=2)
-    
-    # Create vest.json - 150 shares vested
-    vest_data = {
-        "THETA": {
-            "vests": [
-                {
-                    "vest_date": "2023-02-01",
-                    "number_of_shares": 150
-                }
-            ]
+]
+
+def update_dataset(spec: dict):
+    """Write public_data.json, optional vest/sell JSON and expected_FA.csv for one dataset"""
+    data_dir = _HERE / spec["dir"]
+    
+    stocks = {}
+    for symbol, stock in spec["stocks"].items():
+        # Daily prices for the entire year, then the fixed prices for key dates
+        prices = generate_daily_prices(*stock["curve"])
+        prices.update(stock["overrides"])
+        stocks[symbol] = {
+            "prices": prices,
+            "company_info": stock["company_info"],
+            "high_low": stock["high_low"]
         }
+    
+    public_data = {
+        "stocks": stocks,
+        "exchange_rates": spec["exchange_rates"],
+        "country_mapping": _COUNTRY_MAPPING
     }
     
-    with open(data_dir / "vest.json", 'w') as f:
-        json.dump(vest_data, f, indent=2)
+    write_json(data_dir / "public_data.json", public_data)
     
-    # Create sell.json - 60 shares sold in June (before peak in October)
-    sell_data = {
-        "THETA": {
-            "sales": [
-                {
-                    "sell_date": "2023-06-15",
-                    "purchase_date": "2023-02-01",  # Links to vest date
-                    "number_of_shares_sold": 60,
-                    "sell_price_inr": 700000.0  # 60 * $140 * 83.10 ≈ 700,000
-                }
-            ]
-        }
-    }
+    if "vest" in spec:
+        write_json(data_dir / "vest.json", spec["vest"])
     
-    with open(data_dir / "sell.json", 'w') as f:
-        json.dump(sell_data, f, indent=2)
+    if "sell" in spec:
+        write_json(data_dir / "sell.json", spec["sell"])
     
-    # Calculate expected values (based on actual calculator output):
-    # This test demonstrates peak value calculation AFTER partial sale
-    # Initial: 931,500 (calculated by FA calculator using vest date price)
-    # Peak: 1,943,868 (peak occurs after sale with reduced holdings - complex calculation)
-    # Closing: 1,160,640 (90 remaining shares at year end)
-    # Sale proceeds: 700,000 (given in sell.json)
-    expected_csv = [
-        '"Country/Region name","Country Name and Code","Name of entity","Address of entity","ZIP Code","Nature of entity","Date of acquiring the interest","Initial value of the investment","Peak value of investment during the Period","Closing balance","Total gross amount paid/credited with respect to the holding during the period","Total gross proceeds from sale or redemption of investment during the period"',
-        '1,2,Theta Systems,555 Theta Boulevard Thetatown TX,75555,Public Limited Company,2023-02-01,931500,1943868,1160640,0,700000'
-    ]
+    expected_csv = [_FA_HEADER, *spec["expected"]]
     
-    with open(data_dir / "expected_FA.csv", 'w') as f:
-        f.write('\n'.join(expected_csv))
+    write_if_changed(data_dir / "expected_FA.csv", '\n'.join(expected_csv).encode())
 
 def main():
     print("Generating comprehensive test data...")
-    update_data1()
-    update_data2()
-    update_data3()
-    update_data4()
-    update_data5()
+    for spec in DATASETS:
+        update_dataset(spec)
     print("✅ All test data generated successfully!")
 
 if __name__ == "__main__":
@@ -6,8 +6,18 @@ Tests the core calculation logic using pre-cached data (no internet required)
 
 import os
 import sys
-import subprocess
+import argparse
+import compileall
 import csv
+import math
+import multiprocessing
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
+from io import StringIO
+from itertools import zip_longest
 from pathlib import Path
 from typing import List, Dict, Tuple
 
@@ -19,6 +29,46 @@ class Colors:
     BLUE = '\033[0;34m'
     NC = '\033[0m'  # No Color
 
+@lru_cache(maxsize=None)
+def _read_test_year(test_dir: str) -> int:
+    """Parse the year from a test directory's test_config.txt once, default 2023"""
+    config_file = Path(test_dir) / "test_config.txt"
+    if config_file.exists():
+        try:
+            with open(config_file, 'r') as f:
+                for line in f:
+                    if line.startswith("year="):
+                        return int(line.split("=")[1].strip())
+        except:
+            pass
+    return 2023  # Default test year
+
+def _import_calculator(script_dir: str):
+    """Worker initializer: import fa_calculator once per worker process"""
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    import fa_calculator  # noqa: F401
+
+def _run_calculator(test_dir: str, year: int) -> Tuple[int, str]:
+    """Run fa_calculator in this worker process and return (exit code, captured output)"""
+    import fa_calculator
+    args = argparse.Namespace(
+        year=year,
+        data=test_dir,
+        no_internet=True,
+        verbose=False,
+        exclude_validation=True,  # Skip validation for faster tests
+        no_sort=True              # Skip sorting
+    )
+    output = StringIO()
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            fa_calculator.run(args)
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        return code, output.getvalue()
+    return 0, output.getvalue()
+
 class CoreTestRunner:
     def __init__(self):
         self.script_dir = Path(__file__).parent.parent.parent.absolute()
@@ -27,6 +77,10 @@ class CoreTestRunner:
         self.passed = 0
         self.failed = 0
         self.test_results = []
+        # Worker interpreters with fa_calculator imported, one per thread running tests
+        self._local = threading.local()
+        self._calculator_pools = []
+        self._pools_lock = threading.Lock()
         
     def find_test_directories(self) -> List[Path]:
         """Find all data directories in core-tests"""
@@ -39,42 +93,34 @@ class CoreTestRunner:
     
     def get_test_year_from_config(self, test_dir: Path) -> int:
         """Get the test year from test_config.txt or default to 2023"""
-        config_file = test_dir / "test_config.txt"
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    for line in f:
-                        if line.startswith("year="):
-                            return int(line.split("=")[1].strip())
-            except:
-                pass
-        return 2023  # Default test year
+        return _read_test_year(str(test_dir))
     
     def run_fa_calculator(self, test_dir: Path, year: int) -> Tuple[bool, str]:
-        """Run fa_calculator.py for a test directory"""
+        """Run fa_calculator for a test directory in this thread's worker process"""
+        pool = getattr(self._local, "calculator_pool", None)
+        if pool is None:
+            pool = multiprocessing.get_context('spawn').Pool(
+                1, initializer=_import_calculator, initargs=(str(self.script_dir),))
+            # Wait for the worker to start and import fa_calculator, so that time is
+            # not charged against the timeout below
+            pool.apply(os.getpid)
+            self._local.calculator_pool = pool
+            with self._pools_lock:
+                self._calculator_pools.append(pool)
         try:
-            cmd = [
-                sys.executable, str(self.fa_calculator),
-                "--data", str(test_dir),
-                str(year),
-                "--no-internet",
-                "-x",  # Skip validation for faster tests
-                "-y"   # Skip sorting
-            ]
-            
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=30
-            )
+            code, output = pool.apply_async(_run_calculator, (str(test_dir), year)).get(30)
             
-            if result.returncode == 0:
+            if code == 0:
                 return True, "Success"
             else:
-                return False, f"Exit code {result.returncode}: {result.stderr.strip()}"
+                return False, f"Exit code {code}: {output.strip()}"
                 
-        except subprocess.TimeoutExpired:
+        except multiprocessing.TimeoutError:
+            # Stop the hung worker; the next test on this thread starts a new one
+            pool.terminate()
+            self._local.calculator_pool = None
+            with self._pools_lock:
+                self._calculator_pools.remove(pool)
             return False, "Test timed out"
         except Exception as e:
             return False, f"Error running test: {str(e)}"
@@ -88,57 +134,53 @@ class CoreTestRunner:
             if not expected_file.exists():
                 return False, "Expected FA.csv not found"
             
-            # Read both files
-            with open(generated_file, 'r') as f:
-                generated_lines = f.readlines()
+            # Reject empty or truncated output without reading; line endings and
+            # number formatting change the size by a few bytes, well under 10%
+            gen_size = generated_file.stat().st_size
+            exp_size = expected_file.stat().st_size
+            if abs(gen_size - exp_size) > max(gen_size, exp_size) * 0.1:
+                return False, f"Size mismatch: generated={gen_size} bytes, expected={exp_size} bytes"
             
-            with open(expected_file, 'r') as f:
-                expected_lines = f.readlines()
-            
-            # Compare line by line
-            if len(generated_lines) != len(expected_lines):
-                return False, f"Line count mismatch: generated={len(generated_lines)}, expected={len(expected_lines)}"
-            
-            for i, (gen_line, exp_line) in enumerate(zip(generated_lines, expected_lines)):
-                gen_line = gen_line.strip()
-                exp_line = exp_line.strip()
-                
-                if i == 0:  # Header line - exact match
-                    if gen_line != exp_line:
-                        return False, f"Header mismatch at line {i+1}"
-                else:  # Data lines - parse and compare with tolerance for numbers
-                    if not self.compare_csv_data_lines(gen_line, exp_line, i+1):
-                        return False, f"Data mismatch at line {i+1}"
+            # Stream both files through csv.reader and stop at the first difference
+            with open(generated_file, 'r', newline='') as gen_f, open(expected_file, 'r', newline='') as exp_f:
+                rows = zip_longest(csv.reader(gen_f), csv.reader(exp_f))
+                for i, (gen_row, exp_row) in enumerate(rows):
+                    if gen_row is None or exp_row is None:
+                        return False, f"Line count mismatch at line {i+1}"
+                    
+                    if i == 0:  # Header line - exact match
+                        if [part.strip() for part in gen_row] != [part.strip() for part in exp_row]:
+                            return False, f"Header mismatch at line {i+1}"
+                    else:  # Data lines - compare with tolerance for numbers
+                        if not self.compare_csv_data_lines(gen_row, exp_row, i+1):
+                            return False, f"Data mismatch at line {i+1}"
             
             return True, "Files match"
             
         except Exception as e:
             return False, f"Error comparing files: {str(e)}"
     
-    def compare_csv_data_lines(self, gen_line: str, exp_line: str, line_num: int) -> bool:
-        """Compare CSV data lines with numerical tolerance"""
+    def compare_csv_data_lines(self, gen_row: List[str], exp_row: List[str], line_num: int) -> bool:
+        """Compare parsed CSV data rows with numerical tolerance"""
         try:
-            gen_parts = [part.strip() for part in gen_line.split(',')]
-            exp_parts = [part.strip() for part in exp_line.split(',')]
+            if len(gen_row) != len(exp_row):
+                return False
             
-            if len(gen_parts) != len(exp_parts):
+            gen_row = [part.strip() for part in gen_row]
+            exp_row = [part.strip() for part in exp_row]
+            
+            # String comparison for non-numeric columns, as one list comparison
+            if gen_row[:7] != exp_row[:7]:
                 return False
             
-            for i, (gen_val, exp_val) in enumerate(zip(gen_parts, exp_parts)):
-                # Try to parse as numbers for columns that should be numeric
-                if i >= 7:  # Numeric columns (initial value, peak value, etc.)
-                    try:
-                        gen_num = float(gen_val)
-                        exp_num = float(exp_val)
-                        # Allow 1 INR tolerance for rounding differences
-                        if abs(gen_num - exp_num) > 1:
-                            return False
-                    except ValueError:
-                        # Not numeric, compare as strings
-                        if gen_val != exp_val:
-                            return False
-                else:
-                    # String comparison for non-numeric columns
+            # Numeric columns (initial value, peak value, etc.)
+            for gen_val, exp_val in zip(gen_row[7:], exp_row[7:]):
+                try:
+                    # Allow 1 INR tolerance for rounding differences
+                    if not math.isclose(float(gen_val), float(exp_val), rel_tol=0, abs_tol=1.0):
+                        return False
+                except ValueError:
+                    # Not numeric, compare as strings
                     if gen_val != exp_val:
                         return False
             
@@ -148,19 +190,17 @@ class CoreTestRunner:
             return False
     
     def run_single_test(self, test_dir: Path) -> Dict:
-        """Run a single test and return results"""
+        """Run a single test and return results (printed by the caller, tests run concurrently)"""
         test_name = test_dir.name
         year = self.get_test_year_from_config(test_dir)
         
-        print(f"  Running {test_name} (year {year})...", end=" ")
-        
         # Run FA calculator
         success, message = self.run_fa_calculator(test_dir, year)
         
         if not success:
-            print(f"{Colors.RED}FAILED{Colors.NC}")
             return {
                 'name': test_name,
+                'year': year,
                 'status': 'FAILED',
                 'reason': f"Calculator failed: {message}"
             }
@@ -172,20 +212,34 @@ class CoreTestRunner:
         match_success, match_message = self.compare_csv_files(generated_file, expected_file)
         
         if match_success:
-            print(f"{Colors.GREEN}PASSED{Colors.NC}")
             return {
                 'name': test_name,
+                'year': year,
                 'status': 'PASSED',
                 'reason': 'Output matches expected'
             }
         else:
-            print(f"{Colors.RED}FAILED{Colors.NC}")
             return {
                 'name': test_name,
+                'year': year,
                 'status': 'FAILED',
                 'reason': f"Output mismatch: {match_message}"
             }
     
+    def check_size_precheck(self, expected_file: Path):
+        """Self-check: compare_csv_files must reject an empty or truncated FA.csv by size
+        
+        Not a fixture test, so it isn't counted in the results; raises AssertionError on failure.
+        """
+        expected = expected_file.read_bytes()
+        with tempfile.TemporaryDirectory() as tmp:
+            truncated_file = Path(tmp) / "FA.csv"
+            for payload in (b"", expected.splitlines(keepends=True)[0]):
+                truncated_file.write_bytes(payload)
+                match_success, match_message = self.compare_csv_files(truncated_file, expected_file)
+                if match_success or not match_message.startswith("Size mismatch"):
+                    raise AssertionError(f"{len(payload)}-byte FA.csv not rejected by size: {match_message}")
+    
     def run_all_tests(self):
         """Run all core tests"""
         print(f"{Colors.BLUE}🧪 Running Core Tests for FA Calculator{Colors.NC}")
@@ -199,16 +253,33 @@ class CoreTestRunner:
             print(f"{Colors.YELLOW}⚠️  No test directories found in {self.core_tests_dir}{Colors.NC}")
             return
         
+        # Make sure the comparison's size precheck works before relying on it
+        self.check_size_precheck(test_dirs[0] / "expected_FA.csv")
+        
         print(f"Found {len(test_dirs)} test directories:")
         
-        for test_dir in test_dirs:
-            result = self.run_single_test(test_dir)
-            self.test_results.append(result)
-            
-            if result['status'] == 'PASSED':
-                self.passed += 1
-            else:
-                self.failed += 1
+        # Each test runs the calculator on its own directory, so run them concurrently
+        # and report in directory order. Each thread's calculator runs in a worker
+        # process that imports it once and is reused, instead of a fresh interpreter
+        # per test, and is terminated if a run times out.
+        workers = min(len(test_dirs), os.cpu_count() or 1)
+        # Refresh fa_calculator's bytecode once here so workers don't each compile a stale copy
+        compileall.compile_file(str(self.fa_calculator), quiet=1)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for result in executor.map(self.run_single_test, test_dirs):
+                    self.test_results.append(result)
+                    
+                    if result['status'] == 'PASSED':
+                        print(f"  Running {result['name']} (year {result['year']})... {Colors.GREEN}PASSED{Colors.NC}")
+                        self.passed += 1
+                    else:
+                        print(f"  Running {result['name']} (year {result['year']})... {Colors.RED}FAILED{Colors.NC}")
+                        self.failed += 1
+        finally:
+            for pool in self._calculator_pools:
+                pool.close()
+                pool.join()
         
         self.print_summary()
     
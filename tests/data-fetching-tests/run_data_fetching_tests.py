@@ -11,17 +11,75 @@ This script tests the data fetching functionality by:
 This approach is fast (one network call) but tests real API integration.
 """
 
-import subprocess
 import sys
 import os
+import calendar
 import json
+import multiprocessing
 import shutil
 import time
-import urllib.request
 import socket
-from datetime import datetime, timedelta
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import date
+from functools import partial
+from io import StringIO
 from pathlib import Path
 from typing import List, Tuple, Dict, Any
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+# Zero-padded day-of-month strings, indexed by day
+_DAY_SUFFIXES = tuple(f"{day:02d}" for day in range(32))
+
+# Fixture JSON is only read by the calculator, so it is written compact unless
+# FA_TESTS_PRETTY is set in the environment for debugging
+_PRETTY_JSON = bool(os.environ.get("FA_TESTS_PRETTY"))
+
+def write_json(path: Path, data):
+    """Write data as JSON with a single write, atomically replacing the target file
+    
+    Replacing rather than rewriting also never writes through a hard link, see clone_test_data().
+    """
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2) if _PRETTY_JSON else orjson.dumps(data)
+    elif _PRETTY_JSON:
+        payload = json.dumps(data, indent=2).encode()
+    else:
+        payload = json.dumps(data, separators=(",", ":")).encode()
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+def _import_calculator(script_dir: str):
+    """Worker initializer: import fa_calculator once for all calculator runs"""
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    import fa_calculator  # noqa: F401
+
+def _run_calculator(args: List[str], capture_stdout: bool = False) -> Tuple[int, str, str]:
+    """Run fa_calculator's command line in this worker, return (exit code, stdout, stderr)
+    
+    stdout is discarded and returned as "" unless capture_stdout is set; stderr is always kept.
+    """
+    import fa_calculator
+    stderr = StringIO()
+    stdout = StringIO() if capture_stdout else open(os.devnull, 'w')
+    sys.argv = ["fa_calculator.py", *args]
+    with stdout, redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            fa_calculator.main()
+            code = 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        output = stdout.getvalue() if capture_stdout else ""
+    return code, output, stderr.getvalue()
 
 class DataFetchingTestRunner:
     def __init__(self):
@@ -38,6 +96,16 @@ class DataFetchingTestRunner:
         # Test configuration
         self.test_year = 2023
         self.cache_built = False
+        # Year argument shared by every calculator run, see calculator_args()
+        self._year_args = (str(self.test_year),)
+        
+        # public_data.json path -> ((mtime, size), parsed content), see load_cached_data()
+        self._loaded_cache = {}
+        
+        # Worker interpreters with fa_calculator imported, one per thread running tests
+        self._local = threading.local()
+        self._calculator_pools = []
+        self._pools_lock = threading.Lock()
         
     def setup_test_data(self):
         """Create test data directory with partial cache to trigger real fetching"""
@@ -55,30 +123,22 @@ class DataFetchingTestRunner:
             }
         }
         
-        with open(self.test_data_dir / "vest.json", 'w') as f:
-            json.dump(vest_data, f, indent=2)
+        write_json(self.test_data_dir / "vest.json", vest_data)
             
         # Create empty sell.json
-        with open(self.test_data_dir / "sell.json", 'w') as f:
-            json.dump({}, f, indent=2)
+        write_json(self.test_data_dir / "sell.json", {})
             
         # Create comprehensive cache with most of the year's data, missing only ~10 values
         # Generate full year of fake prices, then remove just a few key dates
-        from datetime import datetime, timedelta
-        
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 12, 31)
-        current_date = start_date
-        prices = {}
-        
-        # Generate fake prices for most of the year
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            # Skip weekends
-            if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-                # Use obviously fake prices
-                prices[date_str] = "999.99"
-            current_date += timedelta(days=1)
+        # Weekdays only (Monday = 0, Friday = 4), every one with the same obviously fake price;
+        # date strings are a month prefix plus a precomputed day suffix
+        weekdays = []
+        for month in range(1, 13):
+            first_weekday, days_in_month = calendar.monthrange(self.test_year, month)
+            prefix = f"{self.test_year}-{month:02d}-"
+            weekdays.extend([prefix + _DAY_SUFFIXES[day] for day in range(1, days_in_month + 1)
+                             if (first_weekday + day - 1) % 7 < 5])
+        prices = dict.fromkeys(weekdays, "999.99")
         
         # Remove exactly 10 key dates to force minimal real API fetching
         missing_dates = [
@@ -94,17 +154,12 @@ class DataFetchingTestRunner:
             "2023-11-15"   # Random date
         ]
         
-        for date in missing_dates:
-            prices.pop(date, None)  # Remove these dates to force fetching
+        for missing_date in missing_dates:
+            prices.pop(missing_date, None)  # Remove these dates to force fetching
         
-        # Generate fake exchange rates for most of the year
-        exchange_rates = {}
-        current_date = start_date
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            if current_date.day == 1:  # First of each month
-                exchange_rates[date_str] = "99.99"  # Obviously fake
-            current_date += timedelta(days=1)
+        # Generate fake exchange rates for the first of each month (obviously fake)
+        month_starts = [date(self.test_year, month, 1).isoformat() for month in range(1, 13)]
+        exchange_rates = dict.fromkeys(month_starts, "99.99")
         
         # Remove the vest date exchange rate to force fetching
         exchange_rates.pop("2023-06-01", None)  # Remove June rate
@@ -131,23 +186,40 @@ class DataFetchingTestRunner:
             }
         }
         
-        with open(self.test_data_dir / "public_data.json", 'w') as f:
-            json.dump(partial_cache, f, indent=2)
+        write_json(self.test_data_dir / "public_data.json", partial_cache)
     
-    def run_command(self, cmd: List[str], expect_success: bool = True, timeout: int = 60) -> Tuple[bool, str, str]:
-        """Run a command and return (success, stdout, stderr)"""
+    def calculator_args(self, data_dir: Path, *options: str) -> List[str]:
+        """Build fa_calculator arguments for the test year against data_dir"""
+        return ["--data", str(data_dir), *self._year_args, *options]
+    
+    def run_calculator(self, args: List[str], expect_success: bool = True, timeout: int = 60,
+                       capture_stdout: bool = False) -> Tuple[bool, str, str]:
+        """Run fa_calculator with args in this thread's worker and return (success, stdout, stderr)
+        
+        stdout is only captured when capture_stdout is set, otherwise it comes back as "".
+        """
+        pool = getattr(self._local, "calculator_pool", None)
+        if pool is None:
+            pool = multiprocessing.get_context('spawn').Pool(
+                1, initializer=_import_calculator, initargs=(str(self.script_dir),))
+            # Wait for the worker to start and import fa_calculator, so that time is
+            # not charged against the timeout of the first run below
+            pool.apply(os.getpid)
+            self._local.calculator_pool = pool
+            with self._pools_lock:
+                self._calculator_pools.append(pool)
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            code, stdout, stderr = pool.apply_async(_run_calculator, (args, capture_stdout)).get(timeout)
             
-            success = (result.returncode == 0) == expect_success
-            return success, result.stdout, result.stderr
+            success = (code == 0) == expect_success
+            return success, stdout, stderr
             
-        except subprocess.TimeoutExpired:
+        except multiprocessing.TimeoutError:
+            # The worker may still be waiting on the network, replace it
+            pool.terminate()
+            self._local.calculator_pool = None
+            with self._pools_lock:
+                self._calculator_pools.remove(pool)
             return False, "", "Command timed out"
         except Exception as e:
             return False, "", str(e)
@@ -160,25 +232,72 @@ class DataFetchingTestRunner:
             "https://httpbin.org/get"
         ]
         
-        for url in test_urls:
+        def probe(url: str) -> bool:
+            # A TCP connect to the HTTPS port proves reachability without a TLS handshake
             try:
-                # Set a short timeout for quick failure
-                response = urllib.request.urlopen(url, timeout=5)
-                if response.getcode() == 200:
+                with socket.create_connection((urlparse(url).hostname, 443), timeout=3):
+                    return True
+            except OSError:
+                return False
+        
+        # Probe all hosts concurrently and return on the first success
+        executor = ThreadPoolExecutor(max_workers=len(test_urls))
+        try:
+            futures = [executor.submit(probe, url) for url in test_urls]
+            for future in as_completed(futures):
+                if future.result():
                     return True
-            except (urllib.error.URLError, socket.timeout, socket.error):
-                continue
+        finally:
+            executor.shutdown(wait=False)
         
         return False
 
-    def load_cached_data(self) -> Dict[str, Any]:
-        """Load the cached public_data.json"""
+    def load_cached_data(self, data_dir: Path) -> Dict[str, Any]:
+        """Load public_data.json from data_dir, re-parsing only when the file has changed
+        
+        The parsed dict is shared between calls; a caller that modifies it must write it back.
+        """
+        cache_file = data_dir / "public_data.json"
         try:
-            with open(self.test_data_dir / "public_data.json", 'r') as f:
-                return json.load(f)
+            stat = cache_file.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            loaded = self._loaded_cache.get(cache_file)
+            if loaded is None or loaded[0] != key:
+                raw = cache_file.read_bytes()
+                loaded = self._loaded_cache[cache_file] = (key, orjson.loads(raw) if orjson else json.loads(raw))
+            return loaded[1]
         except:
             return {}
     
+    def save_cached_data(self, data_dir: Path, data: Dict[str, Any]):
+        """Write data to public_data.json in data_dir and keep it as the loaded copy
+        
+        load_cached_data() then returns data without re-reading the file, as long as
+        the file still has the size and mtime this write gave it.
+        """
+        cache_file = data_dir / "public_data.json"
+        write_json(cache_file, data)
+        stat = cache_file.stat()
+        self._loaded_cache[cache_file] = ((stat.st_mtime_ns, stat.st_size), data)
+    
+    def clone_test_data(self, test_name: str) -> Path:
+        """Snapshot test_data into a per-test directory using hard links (copies if unsupported)
+        
+        The calculator saves public_data.json and the sorted vest.json/sell.json, and write_json()
+        writes fixtures, through a temp file and os.replace(), which never writes through a link.
+        FA.csv is written in place, so it is not linked.
+        """
+        work_dir = self.data_fetching_tests_dir / f"work_{test_name}"
+        if work_dir.exists():
+            shutil.rmtree(work_dir)
+        ignore = shutil.ignore_patterns("FA.csv")
+        try:
+            shutil.copytree(self.test_data_dir, work_dir, copy_function=os.link, ignore=ignore)
+        except OSError:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            shutil.copytree(self.test_data_dir, work_dir, ignore=ignore)
+        return work_dir
+    
     def build_cache_with_real_calls(self) -> bool:
         """Run FA calculator once to build cache with real API calls"""
         if self.cache_built:
@@ -186,9 +305,8 @@ class DataFetchingTestRunner:
             
         print("  Building cache with real API calls (should be fast - only ~10 missing values)...")
         
-        cmd = ["python3", str(self.fa_calculator), "--data", str(self.test_data_dir), 
-               str(self.test_year), "-x", "-y"]
-        success, stdout, stderr = self.run_command(cmd, timeout=30)
+        args = self.calculator_args(self.test_data_dir, "-x", "-y")
+        success, stdout, stderr = self.run_calculator(args, timeout=30)
         
         if success:
             self.cache_built = True
@@ -198,12 +316,12 @@ class DataFetchingTestRunner:
             
         return success
     
-    def test_real_data_fetching(self) -> bool:
+    def test_real_data_fetching(self, data_dir: Path) -> bool:
         """Test that missing data was fetched via real API calls while fake data remained"""
         if not self.build_cache_with_real_calls():
             return False
             
-        cached_data = self.load_cached_data()
+        cached_data = self.load_cached_data(data_dir)
         
         # Verify MSFT data exists
         if "stocks" not in cached_data or "MSFT" not in cached_data["stocks"]:
@@ -244,9 +362,9 @@ class DataFetchingTestRunner:
             
         return True
     
-    def test_exchange_rate_fetching(self) -> bool:
+    def test_exchange_rate_fetching(self, data_dir: Path) -> bool:
         """Test that missing exchange rates were fetched while fake ones remained"""
-        cached_data = self.load_cached_data()
+        cached_data = self.load_cached_data(data_dir)
         
         if "exchange_rates" not in cached_data:
             return False
@@ -276,60 +394,60 @@ class DataFetchingTestRunner:
             
         return True
     
-    def test_cache_persistence(self) -> bool:
+    def test_cache_persistence(self, data_dir: Path) -> bool:
         """Test that cached data persists and is reused"""
         # Get current cache
-        cached_data_before = self.load_cached_data()
+        cached_data_before = self.load_cached_data(data_dir)
         
         # Run calculator again with --no-internet (should use cache)
-        cmd = ["python3", str(self.fa_calculator), "--data", str(self.test_data_dir), 
-               str(self.test_year), "--no-internet", "-x", "-y"]
-        success, stdout, stderr = self.run_command(cmd)
+        args = self.calculator_args(data_dir, "--no-internet", "-x", "-y")
+        success, stdout, stderr = self.run_calculator(args)
         
         if not success:
             return False
             
         # Verify FA.csv was generated (proves cache worked)
-        fa_csv = self.test_data_dir / "FA.csv"
+        fa_csv = data_dir / "FA.csv"
         if not fa_csv.exists():
             return False
             
         # Cache should be unchanged
-        cached_data_after = self.load_cached_data()
+        cached_data_after = self.load_cached_data(data_dir)
         
-        # Key data should be the same
-        return (cached_data_before.get("stocks", {}).get("MSFT", {}).get("prices", {}) == 
-                cached_data_after.get("stocks", {}).get("MSFT", {}).get("prices", {}))
+        # Key data should be the same; if the file was not rewritten at all,
+        # load_cached_data() hands back the very same dict and no compare is needed
+        prices_before = cached_data_before.get("stocks", {}).get("MSFT", {}).get("prices", {})
+        prices_after = cached_data_after.get("stocks", {}).get("MSFT", {}).get("prices", {})
+        return prices_after is prices_before or prices_after == prices_before
     
-    def test_data_structure_validation(self) -> bool:
+    def test_data_structure_validation(self, data_dir: Path) -> bool:
         """Test that fetched data has correct structure"""
-        cached_data = self.load_cached_data()
+        cached_data = self.load_cached_data(data_dir)
         
         # Check top-level structure
-        required_keys = ["stocks", "exchange_rates", "country_mapping"]
-        for key in required_keys:
-            if key not in cached_data:
-                return False
+        if not self.check_cache_structure(cached_data):
+            return False
+        if "exchange_rates" not in cached_data or "country_mapping" not in cached_data:
+            return False
         
         # Check MSFT stock data structure
-        if "MSFT" not in cached_data["stocks"]:
+        msft_data = cached_data["stocks"].get("MSFT")
+        if msft_data is None or "prices" not in msft_data or "company_info" not in msft_data:
             return False
-            
-        msft_data = cached_data["stocks"]["MSFT"]
-        stock_required_keys = ["prices", "company_info"]
-        for key in stock_required_keys:
-            if key not in msft_data:
-                return False
         
-        # Validate price data format
-        for date, price in msft_data["prices"].items():
-            try:
-                # Date should be valid format
-                datetime.strptime(date, "%Y-%m-%d")
+        # Validate price data format, one pass over dates and one over prices
+        prices = msft_data["prices"]
+        try:
+            for date_str in prices:
+                # Date should be valid YYYY-MM-DD (fromisoformat also takes other ISO forms on 3.11+)
+                if len(date_str) != 10:
+                    return False
+                date.fromisoformat(date_str)
+            for price in prices.values():
                 # Price should be valid number
                 float(price)
-            except (ValueError, TypeError):
-                return False
+        except (ValueError, TypeError):
+            return False
         
         # Validate company info
         company_info = msft_data["company_info"]
@@ -340,24 +458,23 @@ class DataFetchingTestRunner:
         
         return True
     
-    def test_no_internet_mode(self) -> bool:
+    def test_no_internet_mode(self, data_dir: Path) -> bool:
         """Test --no-internet mode with existing cache"""
         # Should work with existing cache
-        cmd = ["python3", str(self.fa_calculator), "--data", str(self.test_data_dir), 
-               str(self.test_year), "--no-internet", "-x", "-y"]
-        success, stdout, stderr = self.run_command(cmd)
+        args = self.calculator_args(data_dir, "--no-internet", "-x", "-y")
+        success, stdout, stderr = self.run_calculator(args)
         
         if not success:
             return False
             
         # Should generate FA.csv
-        fa_csv = self.test_data_dir / "FA.csv"
+        fa_csv = data_dir / "FA.csv"
         return fa_csv.exists()
     
-    def test_incremental_data_addition(self) -> bool:
+    def test_incremental_data_addition(self, data_dir: Path) -> bool:
         """Test adding new symbol to existing cache (without slow API calls)"""
         # Manually add AAPL data to cache to simulate incremental addition
-        cached_data = self.load_cached_data()
+        cached_data = self.load_cached_data(data_dir)
         
         # Add fake AAPL data to simulate what would be fetched
         cached_data["stocks"]["AAPL"] = {
@@ -375,12 +492,11 @@ class DataFetchingTestRunner:
             }
         }
         
-        # Write back to cache
-        with open(self.test_data_dir / "public_data.json", 'w') as f:
-            json.dump(cached_data, f, indent=2)
+        # Write back to cache, keeping the modified dict as the loaded copy
+        self.save_cached_data(data_dir, cached_data)
         
         # Verify both symbols exist in cache
-        updated_cache = self.load_cached_data()
+        updated_cache = self.load_cached_data(data_dir)
         return ("MSFT" in updated_cache.get("stocks", {}) and 
                 "AAPL" in updated_cache.get("stocks", {}))
     
@@ -398,94 +514,105 @@ class DataFetchingTestRunner:
             }
         }
         
-        invalid_test_dir = self.data_fetching_tests_dir / "invalid_test"
-        invalid_test_dir.mkdir(exist_ok=True)
+        # Throwaway directory, in tmpfs where available
+        invalid_test_dir = Path(tempfile.mkdtemp(prefix="invalid_test_", dir="/dev/shm" if os.path.isdir("/dev/shm") else None))
         
-        with open(invalid_test_dir / "vest.json", 'w') as f:
-            json.dump(invalid_vest_data, f, indent=2)
-        with open(invalid_test_dir / "sell.json", 'w') as f:
-            json.dump({}, f, indent=2)
+        write_json(invalid_test_dir / "vest.json", invalid_vest_data)
+        write_json(invalid_test_dir / "sell.json", {})
         
+        # Empty cache entry for the invalid symbol, so the failure is a cache miss
+        # in --no-internet mode rather than waiting on the API for a bogus ticker
         minimal_cache = {
-            "stocks": {},
+            "stocks": {
+                "INVALID_XYZ": {
+                    "prices": {},
+                    "company_info": {}
+                }
+            },
             "exchange_rates": {},
             "country_mapping": {"United States": 2}
         }
-        with open(invalid_test_dir / "public_data.json", 'w') as f:
-            json.dump(minimal_cache, f, indent=2)
+        write_json(invalid_test_dir / "public_data.json", minimal_cache)
         
         # Run calculator (should handle gracefully) with short timeout
-        cmd = ["python3", str(self.fa_calculator), "--data", str(invalid_test_dir), 
-               str(self.test_year), "-x", "-y"]
-        success, stdout, stderr = self.run_command(cmd, expect_success=False, timeout=15)
+        args = self.calculator_args(invalid_test_dir, "--no-internet", "-x", "-y")
+        success, stdout, stderr = self.run_calculator(args, expect_success=False, timeout=5)
         
         # Cleanup
         shutil.rmtree(invalid_test_dir)
         
-        # Should fail gracefully with appropriate error (or timeout is also acceptable)
-        return True  # Simplified - just test that it doesn't crash the test runner
+        # Should fail gracefully with a non-zero exit; a timed-out run reports success=False
+        return success
     
-    def test_cache_file_format(self) -> bool:
+    def test_cache_file_format(self, data_dir: Path) -> bool:
         """Test that cache file is valid JSON with expected format"""
-        cached_data = self.load_cached_data()
+        cached_data = self.load_cached_data(data_dir)
         
-        # Should be valid JSON (already loaded successfully)
-        if not isinstance(cached_data, dict):
-            return False
-            
-        # Check that it's not empty
-        if not cached_data:
-            return False
-            
-        # Check that it has expected structure
-        if "stocks" not in cached_data:
+        # Should be valid JSON (already loaded successfully) with the expected structure
+        return self.check_cache_structure(cached_data)
+    
+    def check_cache_structure(self, cached_data: Dict[str, Any]) -> bool:
+        """Check the cache layout shared by the structure tests
+        
+        The cache must be a non-empty dict with a "stocks" dict; an MSFT entry, if present,
+        must be a dict whose "prices", if present, is a dict.
+        """
+        if not isinstance(cached_data, dict) or not cached_data:
             return False
-            
-        # Check that stocks data is properly formatted
-        stocks = cached_data["stocks"]
+        
+        stocks = cached_data.get("stocks")
         if not isinstance(stocks, dict):
             return False
-            
-        # If MSFT exists, check its structure
-        if "MSFT" in stocks:
-            msft = stocks["MSFT"]
-            if not isinstance(msft, dict):
-                return False
-            if "prices" in msft and not isinstance(msft["prices"], dict):
-                return False
-                
-        return True
-    
-    def run_test(self, test_name: str, test_func) -> bool:
-        """Run a single test and record results"""
-        print(f"  Running {test_name}...", end=" ")
         
+        msft = stocks.get("MSFT", {})
+        return isinstance(msft, dict) and isinstance(msft.get("prices", {}), dict)
+    
+    def execute_test(self, test_func) -> Tuple[bool, str]:
+        """Run a test function and return (passed, exception message); safe to call from worker threads"""
         try:
-            result = test_func()
-            if result:
-                print("PASSED")
-                self.passed_tests += 1
-                self.test_results.append((test_name, "PASSED", ""))
-                return True
-            else:
-                print("FAILED")
-                self.failed_tests += 1
-                self.test_results.append((test_name, "FAILED", "Test assertion failed"))
-                return False
+            return bool(test_func()), ""
         except Exception as e:
-            print(f"FAILED ({str(e)})")
+            return False, str(e)
+    
+    def record_test(self, test_name: str, passed: bool, error: str) -> bool:
+        """Print and record the result of a test"""
+        if passed:
+            print(f"  Running {test_name}... PASSED")
+            self.passed_tests += 1
+            self.test_results.append((test_name, "PASSED", ""))
+        elif error:
+            print(f"  Running {test_name}... FAILED ({error})")
             self.failed_tests += 1
-            self.test_results.append((test_name, "FAILED", str(e)))
-            return False
+            self.test_results.append((test_name, "FAILED", error))
+        else:
+            print(f"  Running {test_name}... FAILED")
+            self.failed_tests += 1
+            self.test_results.append((test_name, "FAILED", "Test assertion failed"))
+        return passed
+    
+    def run_test(self, test_name: str, test_func) -> bool:
+        """Run a single test and record results"""
+        return self.record_test(test_name, *self.execute_test(test_func))
+    
+    def isolated(self, test_name: str, test_func):
+        """Wrap a test to run against its own snapshot of test_data, removed afterwards"""
+        def run_isolated():
+            work_dir = self.clone_test_data(test_name)
+            try:
+                return test_func(work_dir)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+        
+        return run_isolated
     
     def cleanup_test_data(self):
         """Clean up test data files"""
         if self.test_data_dir.exists():
             # Remove generated files but keep cache for inspection
-            for file in ["FA.csv"]:
-                file_path = self.test_data_dir / file
-                if file_path.exists():
-                    file_path.unlink()
+            try:
+                (self.test_data_dir / "FA.csv").unlink()
+            except FileNotFoundError:
+                pass
     
     def run_all_tests(self):
         """Run all data fetching tests efficiently"""
@@ -513,24 +640,38 @@ class DataFetchingTestRunner:
         # Setup test data
         self.setup_test_data()
         
-        # Define tests - order matters (cache building first)
-        tests = [
+        # Cache building tests run first, in order, on test_data itself (the persisted cache)
+        cache_tests = [
             ("real_data_fetching", self.test_real_data_fetching),
             ("exchange_rate_fetching", self.test_exchange_rate_fetching),
-            ("data_structure_validation", self.test_data_structure_validation),
-            ("cache_file_format", self.test_cache_file_format),
-            ("cache_persistence", self.test_cache_persistence),
-            ("no_internet_mode", self.test_no_internet_mode),
-            ("incremental_data_addition", self.test_incremental_data_addition),
+        ]
+        
+        # The remaining tests are independent: each gets its own snapshot of the built cache
+        # (invalid_symbol_handling uses its own directory), so they run concurrently
+        independent_tests = [
+            ("data_structure_validation", self.isolated("data_structure_validation", self.test_data_structure_validation)),
+            ("cache_file_format", self.isolated("cache_file_format", self.test_cache_file_format)),
+            ("cache_persistence", self.isolated("cache_persistence", self.test_cache_persistence)),
+            ("no_internet_mode", self.isolated("no_internet_mode", self.test_no_internet_mode)),
+            ("incremental_data_addition", self.isolated("incremental_data_addition", self.test_incremental_data_addition)),
             ("invalid_symbol_handling", self.test_invalid_symbol_handling),
         ]
         
         # Run tests
-        for test_name, test_func in tests:
-            self.run_test(test_name, test_func)
+        for test_name, test_func in cache_tests:
+            self.run_test(test_name, partial(test_func, self.test_data_dir))
+        
+        # Results are printed in the order above once each test finishes
+        with ThreadPoolExecutor(max_workers=min(4, len(independent_tests))) as executor:
+            futures = [executor.submit(self.execute_test, test_func) for _, test_func in independent_tests]
+            for (test_name, _), future in zip(independent_tests, futures):
+                self.record_test(test_name, *future.result())
         
         # Cleanup
         self.cleanup_test_data()
+        for pool in self._calculator_pools:
+            pool.close()
+            pool.join()
         
         # Print summary
         print()
@@ -13,16 +13,153 @@ Tests focus on:
 - File handling options
 """
 
-import subprocess
 import sys
 import os
 import json
 import shutil
 import random
-from datetime import datetime, timedelta
+import calendar
+import importlib
+import multiprocessing
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import date
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
 from typing import List, Tuple, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+def _invoke_main(module, args: List[str]) -> Tuple[int, str, str]:
+    """Run a script module's main() in this process with args, return (exit code, stdout, stderr)"""
+    stdout, stderr = StringIO(), StringIO()
+    saved_argv = sys.argv
+    sys.argv = [Path(module.__file__).name, *args]
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                module.main()
+                code = 0
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                # Report like an uncaught exception in a separate interpreter would
+                traceback.print_exc()
+                code = 1
+    finally:
+        sys.argv = saved_argv
+    return code, stdout.getvalue(), stderr.getvalue()
+
+def _import_scripts(script_dir: str):
+    """Worker initializer: import the scripts under test once per worker process"""
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    import fa_calculator  # noqa: F401
+    import clean_up_pii  # noqa: F401
+
+def _invoke_main_by_name(module_name: str, args: List[str]) -> Tuple[int, str, str]:
+    """Worker entry point: _invoke_main() for a module given by name"""
+    return _invoke_main(importlib.import_module(module_name), args)
+
+# Zero-padded day-of-month strings, indexed by day
+_DAY_SUFFIXES = tuple(f"{day:02d}" for day in range(32))
+
+@lru_cache(maxsize=None)
+def _build_fixture() -> Tuple[Tuple[str, bytes], ...]:
+    """Build the test_data files once per process, as (file name, contents) pairs"""
+    # Create sample vest.json
+    vest_data = {
+        "TEST": {
+            "vests": [
+                {
+                    "vest_date": "2023-01-15",
+                    "number_of_shares": 50
+                }
+            ]
+        }
+    }
+    
+    # Create public_data.json with comprehensive daily test data
+    # Generate daily prices for the entire year: a small upward trend plus some
+    # volatility (±2), seeded per day by date ordinal for deterministic output.
+    # A generator per day keeps the global random state untouched.
+    # Date strings are a month prefix plus a precomputed day suffix
+    dates = [
+        f"2023-{month:02d}-" + _DAY_SUFFIXES[day]
+        for month in range(1, 13)
+        for day in range(1, calendar.monthrange(2023, month)[1] + 1)
+    ]
+    start_ordinal = date(2023, 1, 1).toordinal()
+    base_price = 100.0
+    prices = {
+        date_str: f"{base_price + day * 0.02 + random.Random(start_ordinal + day).uniform(-2, 2):.2f}"
+        for day, date_str in enumerate(dates)
+    }
+    
+    public_data = {
+        "stocks": {
+            "TEST": {
+                "prices": prices,
+                "company_info": {
+                    "country": "United States",
+                    "name": "Test Corp",
+                    "address": "123 Test St",
+                    "zip_code": "12345",
+                    "nature": "Public Limited Company"
+                },
+                "high_low": {
+                    "2023-01-15": {
+                        "low": "104.00",
+                        "high": "106.00"
+                    }
+                }
+            }
+        },
+        "exchange_rates": {
+            "2023-01-01": "82.50",
+            "2023-01-15": "82.75",
+            "2023-02-01": "82.80",
+            "2023-03-01": "82.90",
+            "2023-04-01": "83.00",
+            "2023-05-01": "83.10",
+            "2023-06-01": "83.25",
+            "2023-07-01": "83.30",
+            "2023-08-01": "83.20",
+            "2023-09-01": "83.15",
+            "2023-10-01": "83.10",
+            "2023-11-01": "83.05",
+            "2023-12-31": "83.00"
+        },
+        "country_mapping": {
+            "United States": 2
+        }
+    }
+    
+    # sell.json is empty. public_data.json is written with sorted keys, the form the
+    # calculator saves it in, so a run leaves it byte-identical and setup_test_data()
+    # finds nothing to rewrite next time.
+    files = (("vest.json", vest_data, False), ("sell.json", {}, False), ("public_data.json", public_data, True))
+    if orjson:
+        return tuple(
+            (name, orjson.dumps(data, option=orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)))
+            for name, data, sort_keys in files
+        )
+    return tuple((name, json.dumps(data, indent=2, sort_keys=sort_keys).encode()) for name, data, sort_keys in files)
+
+def write_if_changed(path: Path, payload: bytes):
+    """Write payload to path unless the file already holds exactly these bytes"""
+    try:
+        if path.read_bytes() == payload:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(payload)
+
 class OptionsTestRunner:
     def __init__(self):
         self.script_dir = Path(__file__).parent.parent.parent.absolute()  # Project root
@@ -31,6 +168,18 @@ class OptionsTestRunner:
         self.options_tests_dir = Path(__file__).parent
         self.test_data_dir = self.options_tests_dir / "test_data"
         
+        # Import the scripts once, for the --help checks that call main() in-process (see run_main())
+        if str(self.script_dir) not in sys.path:
+            sys.path.insert(0, str(self.script_dir))
+        self.calculator_module = importlib.import_module("fa_calculator")
+        self.clean_up_pii_module = importlib.import_module("clean_up_pii")
+        
+        # Calculator arguments shared by the tests that run on test_data
+        self._test_data_args = ("--data", str(self.test_data_dir), "2023", "--no-internet")
+        
+        # Worker process for runs that need a timeout, see run_isolated()
+        self.worker_pool = None
+        
         # Test results
         self.passed_tests = 0
         self.failed_tests = 0
@@ -39,111 +188,67 @@ class OptionsTestRunner:
     def setup_test_data(self):
         """Create test data directory with sample files"""
         self.test_data_dir.mkdir(exist_ok=True)
+        for name, payload in _build_fixture():
+            write_if_changed(self.test_data_dir / name, payload)
+    
+    def clone_test_data(self, name: str) -> Path:
+        """Snapshot test_data into a separate directory using hard links (copies if unsupported)
         
-        # Create sample vest.json
-        vest_data = {
-            "TEST": {
-                "vests": [
-                    {
-                        "vest_date": "2023-01-15",
-                        "number_of_shares": 50
-                    }
-                ]
-            }
-        }
-        
-        with open(self.test_data_dir / "vest.json", 'w') as f:
-            json.dump(vest_data, f, indent=2)
-            
-        # Create empty sell.json
-        with open(self.test_data_dir / "sell.json", 'w') as f:
-            json.dump({}, f, indent=2)
-            
-        # Create public_data.json with comprehensive daily test data
-        # Generate daily prices for the entire year
-        start_date = datetime(2023, 1, 1)
-        end_date = datetime(2023, 12, 31)
-        current_date = start_date
-        prices = {}
-        
-        base_price = 100.0
-        while current_date <= end_date:
-            # Simple price variation: slight upward trend with some volatility
-            days_from_start = (current_date - start_date).days
-            trend_price = base_price + (days_from_start * 0.02)  # Small upward trend
-            
-            # Add some volatility (±2%)
-            random.seed(current_date.toordinal())  # Deterministic randomness
-            volatility = random.uniform(-2, 2)
-            final_price = trend_price + volatility
-            
-            prices[current_date.strftime("%Y-%m-%d")] = f"{final_price:.2f}"
-            current_date += timedelta(days=1)
-        
-        public_data = {
-            "stocks": {
-                "TEST": {
-                    "prices": prices,
-                    "company_info": {
-                        "country": "United States",
-                        "name": "Test Corp",
-                        "address": "123 Test St",
-                        "zip_code": "12345",
-                        "nature": "Public Limited Company"
-                    },
-                    "high_low": {
-                        "2023-01-15": {
-                            "low": "104.00",
-                            "high": "106.00"
-                        }
-                    }
-                }
-            },
-            "exchange_rates": {
-                "2023-01-01": "82.50",
-                "2023-01-15": "82.75",
-                "2023-02-01": "82.80",
-                "2023-03-01": "82.90",
-                "2023-04-01": "83.00",
-                "2023-05-01": "83.10",
-                "2023-06-01": "83.25",
-                "2023-07-01": "83.30",
-                "2023-08-01": "83.20",
-                "2023-09-01": "83.15",
-                "2023-10-01": "83.10",
-                "2023-11-01": "83.05",
-                "2023-12-31": "83.00"
-            },
-            "country_mapping": {
-                "United States": 2
-            }
-        }
-        
-        with open(self.test_data_dir / "public_data.json", 'w') as f:
-            json.dump(public_data, f, indent=2)
+        fa_calculator saves public_data.json and the sorted vest.json/sell.json through a temp
+        file and os.replace(), which never writes through a link. FA.csv is written in place,
+        so it is not linked.
+        """
+        work_dir = self.options_tests_dir / name
+        if work_dir.exists():
+            shutil.rmtree(work_dir)
+        ignore = shutil.ignore_patterns("FA.csv")
+        try:
+            shutil.copytree(self.test_data_dir, work_dir, copy_function=os.link, ignore=ignore)
+        except OSError:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            shutil.copytree(self.test_data_dir, work_dir, ignore=ignore)
+        return work_dir
     
-    def run_command(self, cmd: List[str], expect_success: bool = True) -> Tuple[bool, str, str]:
-        """Run a command and return (success, stdout, stderr)"""
+    def run_isolated(self, module, args: List[str], expect_success: bool = True) -> Tuple[bool, str, str]:
+        """Run a script's main() in the worker process with args and return (success, stdout, stderr)
+        
+        Used for every run that reads data, so a hang is cut off after 30 seconds instead of
+        stalling the suite. Called from one thread at a time, so a run never waits behind another.
+        """
+        if self.worker_pool is None:
+            self.worker_pool = multiprocessing.get_context('spawn').Pool(
+                1, initializer=_import_scripts, initargs=(str(self.script_dir),))
+            # Wait for the worker to start and import the scripts, so that time is
+            # not charged against the timeout below
+            self.worker_pool.apply(os.getpid)
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            code, stdout, stderr = self.worker_pool.apply_async(
+                _invoke_main_by_name, (module.__name__, args)).get(30)
             
-            success = (result.returncode == 0) == expect_success
-            return success, result.stdout, result.stderr
+            success = (code == 0) == expect_success
+            return success, stdout, stderr
             
-        except subprocess.TimeoutExpired:
+        except multiprocessing.TimeoutError:
+            # Stop the hung worker; the next isolated run starts a new one
+            self.worker_pool.terminate()
+            self.worker_pool = None
             return False, "", "Command timed out"
         except Exception as e:
             return False, "", str(e)
     
+    def run_main(self, module, args: List[str], expect_success: bool = True) -> Tuple[bool, str, str]:
+        """Run a script's main() in-process with args and return (success, stdout, stderr)
+        
+        Only for --help, which just formats text and exits; there is no timeout here.
+        """
+        code, stdout, stderr = _invoke_main(module, args)
+        success = (code == 0) == expect_success
+        return success, stdout, stderr
+    
     def test_help_option(self) -> bool:
         """Test --help option"""
-        cmd = ["python3", str(self.fa_calculator), "--help"]
-        success, stdout, stderr = self.run_command(cmd)
+        args = ["--help"]
+        success, stdout, stderr = self.run_main(self.calculator_module, args)
         
         if not success:
             return False
@@ -154,9 +259,8 @@ class OptionsTestRunner:
     
     def test_verbose_option(self) -> bool:
         """Test -v/--verbose option"""
-        cmd = ["python3", str(self.fa_calculator), "--data", str(self.test_data_dir), 
-               "2023", "--no-internet", "-v"]
-        success, stdout, stderr = self.run_command(cmd)
+        args = [*self._test_data_args, "-v"]
+        success, stdout, stderr = self.run_isolated(self.calculator_module, args)
         
         if not success:
             return False
@@ -167,9 +271,8 @@ class OptionsTestRunner:
     
     def test_skip_validation_option(self) -> bool:
         """Test -x (skip validation) option"""
-        cmd = ["python3", str(self.fa_calculator), "--data", str(self.test_data_dir),
-               "2023", "--no-internet", "-x"]
-        success, stdout, stderr = self.run_command(cmd)
+        args = [*self._test_data_args, "-x"]
+        success, stdout, stderr = self.run_isolated(self.calculator_module, args)
         
         if not success:
             return False
@@ -180,9 +283,8 @@ class OptionsTestRunner:
     
     def test_skip_sorting_option(self) -> bool:
         """Test -y (skip sorting) option"""
-        cmd = ["python3", str(self.fa_calculator), "--data", str(self.test_data_dir),
-               "2023", "--no-internet", "-y"]
-        success, stdout, stderr = self.run_command(cmd)
+        args = [*self._test_data_args, "-y"]
+        success, stdout, stderr = self.run_isolated(self.calculator_module, args)
         
         if not success:
             return False
@@ -192,20 +294,11 @@ class OptionsTestRunner:
     
     def test_data_option(self) -> bool:
         """Test --data option with custom directory"""
-        # Create a separate test directory
-        custom_dir = self.options_tests_dir / "custom_test_data"
-        if custom_dir.exists():
-            shutil.rmtree(custom_dir)
-        custom_dir.mkdir()
-        
-        # Copy test data to custom directory
-        shutil.copy2(self.test_data_dir / "vest.json", custom_dir)
-        shutil.copy2(self.test_data_dir / "sell.json", custom_dir)
-        shutil.copy2(self.test_data_dir / "public_data.json", custom_dir)
+        # Create a separate test directory with a copy of the test data
+        custom_dir = self.clone_test_data("custom_test_data")
         
-        cmd = ["python3", str(self.fa_calculator), "--data", str(custom_dir),
-               "2023", "--no-internet", "-x", "-y"]
-        success, stdout, stderr = self.run_command(cmd)
+        args = ["--data", str(custom_dir), "2023", "--no-internet", "-x", "-y"]
+        success, stdout, stderr = self.run_isolated(self.calculator_module, args)
         
         if not success:
             return False
@@ -220,27 +313,24 @@ class OptionsTestRunner:
     
     def test_invalid_year(self) -> bool:
         """Test invalid year argument"""
-        cmd = ["python3", str(self.fa_calculator), "--data", str(self.test_data_dir),
-               "invalid_year", "--no-internet"]
-        success, stdout, stderr = self.run_command(cmd, expect_success=False)
+        args = ["--data", str(self.test_data_dir), "invalid_year", "--no-internet"]
+        success, stdout, stderr = self.run_isolated(self.calculator_module, args, expect_success=False)
         
         # Should fail and show error message
         return success and ("invalid" in stderr.lower() or "error" in stdout.lower())
     
     def test_missing_data_directory(self) -> bool:
         """Test --data with non-existent directory"""
-        cmd = ["python3", str(self.fa_calculator), "--data", "/non/existent/path",
-               "2023", "--no-internet"]
-        success, stdout, stderr = self.run_command(cmd, expect_success=False)
+        args = ["--data", "/non/existent/path", "2023", "--no-internet"]
+        success, stdout, stderr = self.run_isolated(self.calculator_module, args, expect_success=False)
         
         # Should fail with appropriate error
         return success
     
     def test_combined_options(self) -> bool:
         """Test combination of multiple options"""
-        cmd = ["python3", str(self.fa_calculator), "--data", str(self.test_data_dir),
-               "2023", "--no-internet", "-v", "-x", "-y"]
-        success, stdout, stderr = self.run_command(cmd)
+        args = [*self._test_data_args, "-v", "-x", "-y"]
+        success, stdout, stderr = self.run_isolated(self.calculator_module, args)
         
         if not success:
             return False
@@ -252,8 +342,8 @@ class OptionsTestRunner:
     
     def test_clean_up_pii_help(self) -> bool:
         """Test clean_up_pii.py --help"""
-        cmd = ["python3", str(self.clean_up_pii), "--help"]
-        success, stdout, stderr = self.run_command(cmd)
+        args = ["--help"]
+        success, stdout, stderr = self.run_main(self.clean_up_pii_module, args)
         
         if not success:
             return False
@@ -263,45 +353,37 @@ class OptionsTestRunner:
     
     def test_clean_up_pii_data_option(self) -> bool:
         """Test clean_up_pii.py --data option (dry run style)"""
-        # Create a copy of test data for cleanup test
-        cleanup_dir = self.options_tests_dir / "cleanup_test_data"
-        if cleanup_dir.exists():
-            shutil.rmtree(cleanup_dir)
-        cleanup_dir.mkdir()
-        
-        shutil.copy2(self.test_data_dir / "vest.json", cleanup_dir)
-        shutil.copy2(self.test_data_dir / "sell.json", cleanup_dir)
-        
-        # Test that the script recognizes the --data option (we won't actually run cleanup)
-        cmd = ["python3", str(self.clean_up_pii), "--data", str(cleanup_dir), "--help"]
-        success, stdout, stderr = self.run_command(cmd)
-        
-        # Cleanup
-        shutil.rmtree(cleanup_dir)
+        # Test that the script's parser recognizes the --data option (we won't actually run cleanup)
+        parser = self.clean_up_pii_module.build_parser()
+        try:
+            args = parser.parse_args(["--data", str(self.test_data_dir)])
+        except SystemExit:
+            return False
         
-        return success and "--data" in stdout
+        return args.data == str(self.test_data_dir) and "--data" in parser.format_help()
     
-    def run_test(self, test_name: str, test_func) -> bool:
-        """Run a single test and record results"""
-        print(f"  Running {test_name}...", end=" ")
-        
+    def execute_test(self, test_func) -> Tuple[bool, str]:
+        """Run a test function and return (passed, exception message); safe to call from worker threads"""
         try:
-            result = test_func()
-            if result:
-                print("PASSED")
-                self.passed_tests += 1
-                self.test_results.append((test_name, "PASSED", ""))
-                return True
-            else:
-                print("FAILED")
-                self.failed_tests += 1
-                self.test_results.append((test_name, "FAILED", "Test assertion failed"))
-                return False
+            return bool(test_func()), ""
         except Exception as e:
-            print(f"FAILED ({str(e)})")
+            return False, str(e)
+    
+    def record_test(self, test_name: str, passed: bool, error: str) -> bool:
+        """Print and record the result of a test"""
+        if passed:
+            print(f"  Running {test_name}... PASSED")
+            self.passed_tests += 1
+            self.test_results.append((test_name, "PASSED", ""))
+        elif error:
+            print(f"  Running {test_name}... FAILED ({error})")
             self.failed_tests += 1
-            self.test_results.append((test_name, "FAILED", str(e)))
-            return False
+            self.test_results.append((test_name, "FAILED", error))
+        else:
+            print(f"  Running {test_name}... FAILED")
+            self.failed_tests += 1
+            self.test_results.append((test_name, "FAILED", "Test assertion failed"))
+        return passed
     
     def cleanup_test_data(self):
         """Clean up test data files"""
@@ -336,9 +418,26 @@ class OptionsTestRunner:
             ("clean_up_pii_data_option", self.test_clean_up_pii_data_option),
         ]
         
-        # Run tests
-        for test_name, test_func in tests:
-            self.run_test(test_name, test_func)
+        # Tests that use the worker process run in turn on one worker thread. The rest
+        # call main() in-process, sharing sys.argv and sys.stdout, so they run one at a
+        # time here meanwhile. Results are recorded in the order above.
+        in_process_tests = {"help_option", "clean_up_pii_help", "clean_up_pii_data_option"}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = {
+                test_name: executor.submit(self.execute_test, test_func)
+                for test_name, test_func in tests if test_name not in in_process_tests
+            }
+            results = {
+                test_name: self.execute_test(test_func)
+                for test_name, test_func in tests if test_name not in futures
+            }
+            for test_name, _ in tests:
+                passed, error = futures[test_name].result() if test_name in futures else results[test_name]
+                self.record_test(test_name, passed, error)
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+            self.worker_pool.join()
+            self.worker_pool = None
         
         # Cleanup
         self.cleanup_test_data()
@@ -6,12 +6,78 @@ This script runs both core tests and options tests, providing a comprehensive
 validation of the FA calculator's functionality.
 """
 
+import importlib
+import multiprocessing
+import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
+SUITE_TIMEOUT = 300  # 5 minute timeout per suite
+
+class SuiteTimeoutError(TimeoutError):
+    """An in-process suite ran past its timeout and is still running"""
+
+def import_runner(runner_script: Path):
+    """Import a suite's runner script as a module, or return None if it can't be imported"""
+    runner_dir = str(runner_script.parent)
+    if runner_dir not in sys.path:
+        # Also lets spawned worker processes import the runner's worker functions
+        sys.path.insert(0, runner_dir)
+    try:
+        return importlib.import_module(runner_script.stem)
+    except Exception as e:
+        print(f"⚠️  Could not import {runner_script.name} ({e}), running it in a separate process")
+        return None
+
+def run_runner_main(runner, test_path: Path, timeout: float = SUITE_TIMEOUT) -> bool:
+    """Call a runner module's main() in this process from test_path and return success status
+    
+    main() runs on a daemon thread so a hung suite raises SuiteTimeoutError after timeout seconds
+    instead of blocking this runner. The hung suite can't be stopped, so on timeout the working
+    directory is left as it is and the caller must abort the run (see abort_timed_out_suite()).
+    """
+    outcome = {}
+    
+    def call_main():
+        try:
+            runner.main()
+            outcome["success"] = True
+        except SystemExit as e:
+            outcome["success"] = e.code in (None, 0)
+        except BaseException as e:
+            outcome["error"] = e
+    
+    saved_cwd = os.getcwd()
+    os.chdir(test_path)
+    thread = threading.Thread(target=call_main, name=f"{runner.__name__}-main", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise SuiteTimeoutError(f"{runner.__name__} did not finish within {timeout} seconds")
+    os.chdir(saved_cwd)
+    
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["success"]
+
+def abort_timed_out_suite():
+    """Stop the worker processes of a suite that timed out in this process
+    
+    The suite's own thread keeps running, so no further suite can safely share the process
+    with it; callers stop the run after this and exit without waiting for that thread.
+    """
+    for child in multiprocessing.active_children():
+        child.terminate()
+    for child in multiprocessing.active_children():
+        child.join(5)
+
 def run_test_suite(test_dir: str, test_name: str) -> bool:
-    """Run a test suite and return success status"""
+    """Run a test suite and return success status
+    
+    Raises SuiteTimeoutError if an in-process suite times out; the run must not continue.
+    """
     print(f"🧪 Running {test_name}...")
     print("=" * 60)
     
@@ -30,13 +96,18 @@ def run_test_suite(test_dir: str, test_name: str) -> bool:
         return False
     
     try:
-        result = subprocess.run(
-            ["python3", str(runner_script)],
-            cwd=test_path,
-            timeout=300  # 5 minute timeout
-        )
+        # Run the suite in this interpreter, saving a python3 start and re-import per suite
+        runner = import_runner(runner_script)
+        if runner is not None:
+            success = run_runner_main(runner, test_path)
+        else:
+            result = subprocess.run(
+                ["python3", str(runner_script)],
+                cwd=test_path,
+                timeout=SUITE_TIMEOUT
+            )
+            success = result.returncode == 0
         
-        success = result.returncode == 0
         if success:
             print(f"✅ {test_name} completed successfully")
         else:
@@ -49,6 +120,11 @@ def run_test_suite(test_dir: str, test_name: str) -> bool:
         print(f"❌ {test_name} timed out")
         print()
         return False
+    except SuiteTimeoutError:
+        print(f"❌ {test_name} timed out, stopping its workers and skipping the remaining suites")
+        print()
+        abort_timed_out_suite()
+        raise
     except Exception as e:
         print(f"❌ {test_name} error: {e}")
         print()
@@ -85,10 +161,20 @@ def main():
     results = []
     total_passed = 0
     total_failed = 0
+    aborted = False
     
     # Run each test suite
-    for test_dir, test_name in test_suites:
-        success = run_test_suite(test_dir, test_name)
+    for index, (test_dir, test_name) in enumerate(test_suites):
+        try:
+            success = run_test_suite(test_dir, test_name)
+        except SuiteTimeoutError:
+            # The timed-out suite is still running in this process, so don't start
+            # another suite alongside it; the suites left over count as failed
+            results.append((test_name, False))
+            results.extend((skipped_name, None) for _, skipped_name in test_suites[index + 1:])
+            total_failed += len(test_suites) - index
+            aborted = True
+            break
         results.append((test_name, success))
         
         if success:
@@ -106,7 +192,10 @@ def main():
     
     # Show individual results
     for test_name, success in results:
-        status = "✅ PASSED" if success else "❌ FAILED"
+        if success is None:
+            status = "⏭️  NOT RUN"
+        else:
+            status = "✅ PASSED" if success else "❌ FAILED"
         print(f"  {status}: {test_name}")
     
     print()
@@ -118,6 +207,14 @@ def main():
         print(f"⚠️  {total_failed} test suite(s) failed.")
         print("Please review the failures before using the calculator.")
     
+    if aborted:
+        # The timed-out suite's threads would hold up a normal exit until the suite
+        # finishes, so stop any workers its pools restarted and exit immediately
+        abort_timed_out_suite()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
+    
     # Return appropriate exit code
     sys.exit(0 if total_failed == 0 else 1)
 